@@ -1,13 +1,57 @@
 # agents/nutrition_analyst.py - Complete Edamam API Integration
+import logging
 import os
-import requests
-from anthropic import Anthropic
+import sys
 from typing import Dict, List, Optional
 import json
 import re
 from dataclasses import dataclass
 import math
 
+if __name__ == "__main__":
+    # Run directly (python agents/nutrition_analyst.py): sys.path[0] is agents/, so add the project root for tools/
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.anthropic_client import get_client
+from tools.http_session import session as http_session
+
+logger = logging.getLogger(__name__)
+
+# Compiled once: ingredient cleaning and parsing run for every ingredient of every recipe
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_PARENTHETICAL_RE = re.compile(r'\([^)]*\)')
+_LIST_PUNCTUATION_RE = re.compile(r'[,;]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Cooking-method and size words removed before sending ingredients to Edamam,
+# matched in a single pass (longest phrase first, so 'extra large' beats 'large')
+_INGREDIENT_NOISE_WORDS = [
+    'finely chopped', 'roughly chopped', 'finely diced', 'roughly diced',
+    'minced', 'sliced thin', 'sliced thick', 'thinly sliced', 'thickly sliced',
+    'fresh', 'dried', 'ground', 'crushed', 'grated', 'shredded',
+    'to taste', 'optional', 'for serving', 'for garnish', 'for decoration',
+    'at room temperature', 'cold', 'warm', 'hot', 'chilled', 'frozen',
+    'large', 'medium', 'small', 'extra large', 'jumbo'
+]
+_INGREDIENT_NOISE_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(word) for word in sorted(_INGREDIENT_NOISE_WORDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_SEASONING_ONLY = frozenset(['salt', 'pepper', 'black pepper', 'white pepper', 'to taste'])
+
+# Quantity patterns in priority order, for the built-in ingredient database
+_QUANTITY_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(\d+(?:\.\d+)?)\s*(?:lbs?|pounds?)',
+    r'(\d+(?:\.\d+)?)\s*(?:cups?)',
+    r'(\d+(?:\.\d+)?)\s*(?:tbsp|tablespoons?)',
+    r'(\d+(?:\.\d+)?)\s*(?:tsp|teaspoons?)',
+    r'(\d+(?:\.\d+)?)\s*(?:oz|ounces?)',
+)]
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+_UNIT_WORDS_RE = re.compile(r'\b(?:cups?|tbsp|tsp|lbs?|pounds?|oz|ounces?|tablespoons?|teaspoons?)\b')
+_PREP_WORDS_RE = re.compile(r'\b(?:diced|chopped|sliced|minced|fresh|dried|ground)\b')
+
 @dataclass
 class NutritionData:
     calories: float
@@ -21,7 +65,7 @@ class NutritionData:
 
 class NutritionAnalyst:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
         
         # Edamam Nutrition API setup
@@ -47,7 +91,7 @@ class NutritionAnalyst:
         Analyze nutritional content of a recipe using AI-powered estimation as primary method
         """
         
-        print(f"🥗 Analyzing nutrition for: {recipe.get('title', 'Unknown Recipe')}")
+        logger.info("🥗 Analyzing nutrition for: %s", recipe.get('title', 'Unknown Recipe'))
         
         try:
             ingredients = recipe.get('ingredients', [])
@@ -56,7 +100,7 @@ class NutritionAnalyst:
             nutrition_data = None
             
             # Approach 1: Use AI-powered nutrition estimation (PRIMARY METHOD)
-            print("🤖 Using AI-powered nutrition estimation...")
+            logger.info("🤖 Using AI-powered nutrition estimation...")
             nutrition_data = self._analyze_with_ai_enhanced(recipe)
             
             # Approach 2: Try Edamam Nutrition API (disabled for now)
@@ -90,13 +134,13 @@ class NutritionAnalyst:
             }
             
         except Exception as e:
-            print(f"⚠️  Nutrition analysis failed: {str(e)}")
+            logger.warning("⚠️  Nutrition analysis failed: %s", e)
             return self._create_fallback_nutrition(recipe)
     
     def _analyze_with_ai_enhanced(self, recipe: Dict) -> Dict:
         """Enhanced AI nutrition analysis with detailed consideration"""
         
-        print("  🤖 Using enhanced AI nutrition estimation...")
+        logger.info("  🤖 Using enhanced AI nutrition estimation...")
         
         # Prepare comprehensive recipe data for AI analysis
         recipe_context = {
@@ -155,7 +199,7 @@ Provide your best professional estimation based on culinary and nutritional know
 """
         
         try:
-            print(f"  🤖 Sending detailed nutrition analysis to Claude...")
+            logger.info("  🤖 Sending detailed nutrition analysis to Claude...")
             
             response = self.client.messages.create(
                 model=self.model,
@@ -164,28 +208,28 @@ Provide your best professional estimation based on culinary and nutritional know
             )
             
             nutrition_text = response.content[0].text.strip()
-            print(f"  🤖 Claude nutrition response length: {len(nutrition_text)} characters")
+            logger.info("  🤖 Claude nutrition response length: %s characters", len(nutrition_text))
             
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', nutrition_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(nutrition_text)
             if json_match:
                 result = json.loads(json_match.group())
                 
                 # Validate and clean the results
                 result = self._validate_ai_nutrition_result(result)
                 
-                print(f"  ✅ AI nutrition estimation complete")
-                print(f"     Calories: {result.get('calories', 'N/A')} per serving")
-                print(f"     Protein: {result.get('protein', 'N/A')}g per serving")
-                print(f"     Confidence: {result.get('confidence', 'medium')}")
+                logger.info("  ✅ AI nutrition estimation complete")
+                logger.info("     Calories: %s per serving", result.get('calories', 'N/A'))
+                logger.info("     Protein: %sg per serving", result.get('protein', 'N/A'))
+                logger.info("     Confidence: %s", result.get('confidence', 'medium'))
                 
                 return result
             else:
-                print(f"  ❌ Could not extract JSON from AI response")
+                logger.error("  ❌ Could not extract JSON from AI response")
                 return None
         
         except Exception as e:
-            print(f"  ❌ AI nutrition estimation failed: {str(e)}")
+            logger.error("  ❌ AI nutrition estimation failed: %s", e)
             return None
     
     def _extract_cooking_methods(self, instructions: List[str]) -> List[str]:
@@ -249,7 +293,7 @@ Provide your best professional estimation based on culinary and nutritional know
         # Sanity check: calories should roughly match macronutrients
         calculated_calories = (validated['protein'] * 4) + (validated['carbs'] * 4) + (validated['fat'] * 9)
         if abs(validated['calories'] - calculated_calories) > validated['calories'] * 0.3:  # 30% tolerance
-            print(f"  ⚠️ Calorie mismatch detected, adjusting...")
+            logger.warning("  ⚠️ Calorie mismatch detected, adjusting...")
             # Adjust calories to match macronutrients more closely
             validated['calories'] = round((validated['calories'] + calculated_calories) / 2)
         
@@ -319,7 +363,7 @@ Provide your best professional estimation based on culinary and nutritional know
         """Analyze nutrition using Edamam Nutrition API (KEPT FOR FUTURE USE)"""
         
         try:
-            print("  🔬 Using Edamam Nutrition API...")
+            logger.info("  🔬 Using Edamam Nutrition API...")
             
             # Prepare ingredient list for Edamam
             edamam_ingredients = []
@@ -331,11 +375,11 @@ Provide your best professional estimation based on culinary and nutritional know
                     edamam_ingredients.append(cleaned)
             
             if not edamam_ingredients:
-                print("  ⚠️  No valid ingredients for API")
+                logger.warning("  ⚠️  No valid ingredients for API")
                 return None
             
             # Debug: show what we're sending
-            print(f"  📋 Cleaned ingredients: {edamam_ingredients[:5]}...")
+            logger.info("  📋 Cleaned ingredients: %s...", edamam_ingredients[:5])
             
             # Try different approaches to get nutrition data
             
@@ -347,7 +391,7 @@ Provide your best professional estimation based on culinary and nutritional know
             # Approach 2: Try with just main ingredients (remove seasonings/small items)
             main_ingredients = self._filter_main_ingredients(edamam_ingredients)
             if len(main_ingredients) != len(edamam_ingredients):
-                print("  🔄 Trying with main ingredients only...")
+                logger.info("  🔄 Trying with main ingredients only...")
                 result = self._try_nutrition_details_api(main_ingredients, servings)
                 if result:
                     return result
@@ -355,16 +399,16 @@ Provide your best professional estimation based on culinary and nutritional know
             # Approach 3: Try with simplified ingredient names
             simplified = self._simplify_ingredients(edamam_ingredients)
             if simplified != edamam_ingredients:
-                print("  🔄 Trying with simplified ingredients...")
+                logger.info("  🔄 Trying with simplified ingredients...")
                 result = self._try_nutrition_details_api(simplified, servings)
                 if result:
                     return result
             
-            print("  ❌ All Edamam approaches failed")
+            logger.error("  ❌ All Edamam approaches failed")
             return None
                 
         except Exception as e:
-            print(f"  ❌ Edamam API failed: {str(e)}")
+            logger.error("  ❌ Edamam API failed: %s", e)
             return None
     
     def _filter_main_ingredients(self, ingredients: List[str]) -> List[str]:
@@ -438,63 +482,63 @@ Provide your best professional estimation based on culinary and nutritional know
                 'app_key': self.edamam_app_key
             }
             
-            print(f"  📤 Nutrition API: {len(ingredients)} ingredients...")
+            logger.info("  📤 Nutrition API: %s ingredients...", len(ingredients))
             
-            response = requests.post(
+            response = http_session.post(
                 self.edamam_nutrition_url,
                 params=params,
                 json=recipe_data,
                 timeout=15
             )
             
-            print(f"  📡 Response Status: {response.status_code}")
+            logger.info("  📡 Response Status: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
                 
                 # Debug the response structure
-                print(f"  📋 Response keys: {list(data.keys())}")
+                logger.info("  📋 Response keys: %s", list(data.keys()))
                 
                 # Check for nutrition data
                 nutrition = data.get('totalNutrients', {})
                 
                 if nutrition:
                     calories = self._extract_nutrient_value(nutrition, 'ENERC_KCAL')
-                    print(f"  📊 Total calories found: {calories}")
+                    logger.info("  📊 Total calories found: %s", calories)
                     
                     if calories > 0:
                         result = self._parse_nutrition_data(nutrition, servings, 'edamam_nutrition_api')
-                        print(f"  ✅ Nutrition API success - {result['calories']} cal/serving")
+                        logger.info("  ✅ Nutrition API success - %s cal/serving", result['calories'])
                         return result
                     else:
-                        print(f"  ⚠️  Zero calories returned - ingredients not recognized")
+                        logger.warning("  ⚠️  Zero calories returned - ingredients not recognized")
                 else:
-                    print(f"  ⚠️  No totalNutrients in response")
+                    logger.warning("  ⚠️  No totalNutrients in response")
                     
                     # Check if ingredients were parsed at all
                     if 'ingredients' in data:
                         parsed_ingredients = data['ingredients']
-                        print(f"  📋 Parsed {len(parsed_ingredients)} ingredients")
+                        logger.info("  📋 Parsed %s ingredients", len(parsed_ingredients))
                         for i, parsed in enumerate(parsed_ingredients[:3]):
-                            print(f"    {i+1}. {parsed.get('text', 'Unknown')}")
+                            logger.info("    %s. %s", i+1, parsed.get('text', 'Unknown'))
                 
                 return None
             
             elif response.status_code == 422:
-                print(f"  ⚠️  API couldn't parse ingredients (422)")
+                logger.warning("  ⚠️  API couldn't parse ingredients (422)")
                 try:
                     error_data = response.json()
                     if 'message' in error_data:
-                        print(f"  📋 Error: {error_data['message']}")
+                        logger.warning("  📋 Error: %s", error_data['message'])
                 except:
                     pass
                 return None
             else:
-                print(f"  ❌ API error {response.status_code}")
+                logger.error("  ❌ API error %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"  ❌ API exception: {str(e)}")
+            logger.error("  ❌ API exception: %s", e)
             return None
     
     def _parse_nutrition_data(self, nutrition: Dict, servings: int, method: str) -> Dict:
@@ -519,25 +563,14 @@ Provide your best professional estimation based on culinary and nutritional know
         cleaned = ingredient.strip()
         
         # Remove parenthetical notes 
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned)
+        cleaned = _PARENTHETICAL_RE.sub('', cleaned)
         
         # Remove cooking method words but keep the core ingredient + measurement
-        remove_words = [
-            'finely chopped', 'roughly chopped', 'finely diced', 'roughly diced',
-            'minced', 'sliced thin', 'sliced thick', 'thinly sliced', 'thickly sliced',
-            'fresh', 'dried', 'ground', 'crushed', 'grated', 'shredded',
-            'to taste', 'optional', 'for serving', 'for garnish', 'for decoration',
-            'at room temperature', 'cold', 'warm', 'hot', 'chilled', 'frozen',
-            'large', 'medium', 'small', 'extra large', 'jumbo'
-        ]
-        
-        # Remove these words but preserve the structure
-        for word in remove_words:
-            cleaned = re.sub(r'\b' + re.escape(word) + r'\b', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _INGREDIENT_NOISE_RE.sub('', cleaned)
         
         # Clean up punctuation and extra spaces
-        cleaned = re.sub(r'[,;]', ' ', cleaned)
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = _LIST_PUNCTUATION_RE.sub(' ', cleaned)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned)
         cleaned = cleaned.strip()
         
         # Skip empty or very short results
@@ -545,8 +578,7 @@ Provide your best professional estimation based on culinary and nutritional know
             return None
         
         # Skip seasoning-only ingredients without measurements
-        seasoning_only = ['salt', 'pepper', 'black pepper', 'white pepper', 'to taste']
-        if any(cleaned.lower().strip() == seasoning for seasoning in seasoning_only):
+        if cleaned.lower() in _SEASONING_ONLY:
             return None
         
         # Edamam works better with more natural language, so don't over-clean
@@ -562,7 +594,7 @@ Provide your best professional estimation based on culinary and nutritional know
     def _analyze_with_database(self, ingredients: List[str], servings: int) -> Optional[Dict]:
         """Analyze nutrition using built-in ingredient database"""
         
-        print("  📚 Using ingredient database...")
+        logger.info("  📚 Using ingredient database...")
         
         total_nutrition = {
             'calories': 0,
@@ -599,7 +631,7 @@ Provide your best professional estimation based on culinary and nutritional know
             total_nutrition['method'] = 'ingredient_database'
             total_nutrition['confidence'] = 'medium' if matched_ingredients >= len(ingredients) * 0.6 else 'low'
             
-            print(f"  ✅ Database matched {matched_ingredients}/{len(ingredients)} ingredients")
+            logger.info("  ✅ Database matched %s/%s ingredients", matched_ingredients, len(ingredients))
             return total_nutrition
         
         return None
@@ -609,26 +641,17 @@ Provide your best professional estimation based on culinary and nutritional know
         
         ingredient_lower = ingredient.lower().strip()
         
-        # Common quantity patterns
-        quantity_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:lbs?|pounds?)',
-            r'(\d+(?:\.\d+)?)\s*(?:cups?)',
-            r'(\d+(?:\.\d+)?)\s*(?:tbsp|tablespoons?)',
-            r'(\d+(?:\.\d+)?)\s*(?:tsp|teaspoons?)',
-            r'(\d+(?:\.\d+)?)\s*(?:oz|ounces?)',
-        ]
-        
         quantity = 1.0  # default
-        for pattern in quantity_patterns:
-            match = re.search(pattern, ingredient_lower)
+        for pattern in _QUANTITY_PATTERNS:
+            match = pattern.search(ingredient_lower)
             if match:
                 quantity = float(match.group(1))
                 break
         
         # Extract the main food item (simplified)
-        food_words = re.sub(r'\d+(?:\.\d+)?', '', ingredient_lower)
-        food_words = re.sub(r'\b(?:cups?|tbsp|tsp|lbs?|pounds?|oz|ounces?|tablespoons?|teaspoons?)\b', '', food_words)
-        food_words = re.sub(r'\b(?:diced|chopped|sliced|minced|fresh|dried|ground)\b', '', food_words)
+        food_words = _NUMBER_RE.sub('', ingredient_lower)
+        food_words = _UNIT_WORDS_RE.sub('', food_words)
+        food_words = _PREP_WORDS_RE.sub('', food_words)
         food_item = food_words.strip().strip(',')
         
         return {
@@ -640,7 +663,7 @@ Provide your best professional estimation based on culinary and nutritional know
     def _parse_servings(self, servings_str: str) -> int:
         """Parse servings string to get number"""
         try:
-            numbers = re.findall(r'\d+', str(servings_str))
+            numbers = _DIGITS_RE.findall(str(servings_str))
             return int(numbers[0]) if numbers else 4
         except:
             return 4
@@ -648,7 +671,7 @@ Provide your best professional estimation based on culinary and nutritional know
     def _analyze_with_ai(self, recipe: Dict) -> Dict:
         """Use AI to estimate nutrition when other methods fail (LEGACY METHOD)"""
         
-        print("  🤖 Using AI estimation...")
+        logger.info("  🤖 Using AI estimation...")
         
         nutrition_prompt = f"""
 Analyze the nutritional content of this recipe and provide estimates per serving:
@@ -684,14 +707,14 @@ Base estimates on typical nutritional values for similar dishes.
             nutrition_text = response.content[0].text.strip()
             
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', nutrition_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(nutrition_text)
             if json_match:
                 result = json.loads(json_match.group())
-                print(f"  ✅ AI nutrition estimation complete")
+                logger.info("  ✅ AI nutrition estimation complete")
                 return result
         
         except Exception as e:
-            print(f"  ❌ AI nutrition estimation failed: {str(e)}")
+            logger.error("  ❌ AI nutrition estimation failed: %s", e)
         
         # Ultimate fallback
         return self._create_basic_nutrition_estimate(recipe)
@@ -870,6 +893,7 @@ Base estimates on typical nutritional values for similar dishes.
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Test recipe
     test_recipe = {
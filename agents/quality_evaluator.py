@@ -1,10 +1,22 @@
 # agents/quality_evaluator.py
+import logging
 import os
-from anthropic import Anthropic
+import sys
 from typing import Dict, List, Tuple
 import json
+import re
 import statistics
 from dataclasses import dataclass
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+
+if __name__ == "__main__":
+    # Run directly (python agents/quality_evaluator.py): sys.path[0] is agents/, so add the project root for tools/
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.anthropic_client import get_client
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class QualityMetrics:
@@ -18,7 +30,7 @@ class QualityMetrics:
 
 class QualityEvaluator:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
         
         # Quality thresholds for different aspects
@@ -37,30 +49,43 @@ class QualityEvaluator:
             'complexity_alignment': 0.20  # New metric for complexity matching
         }
         
-        print("⭐ QualityEvaluator initialized with complexity-aware scoring")
+        logger.info("⭐ QualityEvaluator initialized with complexity-aware scoring")
     
     def evaluate_recipe(self, recipe: Dict, nutrition_data: Dict = None, inspiration_data: Dict = None, complexity: str = "Medium") -> Dict:
         """
         Comprehensive recipe quality evaluation with complexity consideration
         Returns scoring and recommendations for improvement
+        
+        nutrition_data may be a Future still being computed; only the nutrition check waits on it
         """
         
-        print(f"⭐ Evaluating quality of: {recipe.get('title', 'Unknown Recipe')} (Expected: {complexity} complexity)")
+        logger.info("⭐ Evaluating quality of: %s (Expected: %s complexity)", recipe.get('title', 'Unknown Recipe'), complexity)
         
         try:
-            # Evaluate different quality dimensions
-            creativity_result = self._evaluate_creativity(recipe, inspiration_data, complexity)
-            practicality_result = self._evaluate_practicality(recipe, complexity)
-            nutrition_result = self._evaluate_nutrition_quality(nutrition_data) if nutrition_data else None
-            completeness_result = self._evaluate_completeness(recipe)
-            complexity_alignment_result = self._evaluate_complexity_alignment(recipe, complexity)
+            # Evaluate different quality dimensions - the Claude-backed checks are
+            # independent of each other, so run them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                creativity_future = executor.submit(self._evaluate_creativity, recipe, inspiration_data, complexity)
+                practicality_future = executor.submit(self._evaluate_practicality, recipe, complexity)
+                if isinstance(nutrition_data, Future):
+                    nutrition_future = executor.submit(self._evaluate_pending_nutrition, nutrition_data)
+                else:
+                    nutrition_future = executor.submit(self._evaluate_nutrition_quality, nutrition_data) if nutrition_data else None
+                complexity_alignment_future = executor.submit(self._evaluate_complexity_alignment, recipe, complexity)
+                
+                completeness_result = self._evaluate_completeness(recipe)
+                
+                creativity_result = creativity_future.result()
+                practicality_result = practicality_future.result()
+                nutrition_result = nutrition_future.result() if nutrition_future else None
+                complexity_alignment_result = complexity_alignment_future.result()
             
             # Debug output for each evaluation
-            print(f"⭐ Creativity Score: {creativity_result.get('score', 'N/A')}/10")
-            print(f"⭐ Practicality Score: {practicality_result.get('score', 'N/A')}/10")
-            print(f"⭐ Nutrition Score: {nutrition_result.get('score', 'N/A') if nutrition_result else 'N/A'}/10")
-            print(f"⭐ Completeness Score: {completeness_result.get('score', 'N/A')}/10")
-            print(f"⭐ Complexity Alignment Score: {complexity_alignment_result.get('score', 'N/A')}/10")
+            logger.info("⭐ Creativity Score: %s/10", creativity_result.get('score', 'N/A'))
+            logger.info("⭐ Practicality Score: %s/10", practicality_result.get('score', 'N/A'))
+            logger.info("⭐ Nutrition Score: %s/10", nutrition_result.get('score', 'N/A') if nutrition_result else 'N/A')
+            logger.info("⭐ Completeness Score: %s/10", completeness_result.get('score', 'N/A'))
+            logger.info("⭐ Complexity Alignment Score: %s/10", complexity_alignment_result.get('score', 'N/A'))
             
             # Calculate weighted overall score
             overall_score = self._calculate_overall_score(
@@ -68,7 +93,7 @@ class QualityEvaluator:
                 completeness_result, complexity_alignment_result
             )
             
-            print(f"⭐ Overall Weighted Score: {overall_score}/10")
+            logger.info("⭐ Overall Weighted Score: %s/10", overall_score)
             
             # Generate improvement recommendations
             recommendations = self._generate_improvement_recommendations(
@@ -79,7 +104,7 @@ class QualityEvaluator:
             # Determine if recipe meets quality threshold
             quality_verdict = self._determine_quality_verdict(overall_score)
             
-            print(f"⭐ Quality Verdict: {quality_verdict} ({self._get_quality_level(overall_score)})")
+            logger.info("⭐ Quality Verdict: %s (%s)", quality_verdict, self._get_quality_level(overall_score))
             
             return {
                 'score': overall_score,
@@ -100,13 +125,13 @@ class QualityEvaluator:
             }
             
         except Exception as e:
-            print(f"⚠️  Quality evaluation failed: {str(e)}")
+            logger.warning("⚠️  Quality evaluation failed: %s", e)
             return self._create_fallback_evaluation(recipe, complexity)
     
     def _evaluate_complexity_alignment(self, recipe: Dict, expected_complexity: str) -> Dict:
         """Evaluate how well the recipe matches the expected complexity level"""
         
-        print(f"⭐ Evaluating complexity alignment for {expected_complexity} level...")
+        logger.info("⭐ Evaluating complexity alignment for %s level...", expected_complexity)
         
         # Prepare recipe data for complexity evaluation
         recipe_data = {
@@ -160,14 +185,14 @@ Score 10 = perfect alignment, 5 = somewhat matches, 1 = completely wrong complex
             result = self._extract_evaluation_json(response.content[0].text)
             score = result.get('score', 5.0)
             
-            print(f"⭐ Complexity alignment: {score}/10 for {expected_complexity}")
+            logger.info("⭐ Complexity alignment: %s/10 for %s", score, expected_complexity)
             if result.get('alignment_analysis'):
-                print(f"⭐ Analysis: {result['alignment_analysis'][:100]}...")
+                logger.info("⭐ Analysis: %s...", result['alignment_analysis'][:100])
             
             return result
             
         except Exception as e:
-            print(f"⚠️ Complexity alignment evaluation failed: {str(e)}")
+            logger.warning("⚠️ Complexity alignment evaluation failed: %s", e)
             return self._fallback_complexity_score(recipe, expected_complexity)
     
     def _get_complexity_criteria(self, complexity: str) -> str:
@@ -210,7 +235,7 @@ GOURMET COMPLEXITY CRITERIA:
     def _evaluate_creativity(self, recipe: Dict, inspiration_data: Dict = None, complexity: str = "Medium") -> Dict:
         """Evaluate the creativity and innovation of the recipe with complexity context"""
         
-        print(f"⭐ Evaluating creativity for {complexity} complexity level...")
+        logger.info("⭐ Evaluating creativity for %s complexity level...", complexity)
         
         # Prepare recipe data for evaluation
         recipe_data = {
@@ -267,18 +292,18 @@ Rate creativity relative to the {complexity} complexity level expectations.
             
             result = self._extract_evaluation_json(response.content[0].text)
             score = result.get('score', 5.0)
-            print(f"⭐ Creativity: {score}/10 for {complexity} level")
+            logger.info("⭐ Creativity: %s/10 for %s level", score, complexity)
             
             return result
             
         except Exception as e:
-            print(f"⚠️ Creativity evaluation failed: {str(e)}")
+            logger.warning("⚠️ Creativity evaluation failed: %s", e)
             return self._fallback_creativity_score(recipe)
     
     def _evaluate_practicality(self, recipe: Dict, complexity: str = "Medium") -> Dict:
         """Evaluate how practical and achievable the recipe is with complexity expectations"""
         
-        print(f"⭐ Evaluating practicality for {complexity} complexity level...")
+        logger.info("⭐ Evaluating practicality for %s complexity level...", complexity)
         
         # Prepare recipe data for practicality evaluation
         practicality_data = {
@@ -334,21 +359,26 @@ Rate against {complexity} complexity expectations, not absolute simplicity.
             
             result = self._extract_evaluation_json(response.content[0].text)
             score = result.get('score', 5.0)
-            print(f"⭐ Practicality: {score}/10 for {complexity} level")
+            logger.info("⭐ Practicality: %s/10 for %s level", score, complexity)
             
             return result
             
         except Exception as e:
-            print(f"⚠️ Practicality evaluation failed: {str(e)}")
+            logger.warning("⚠️ Practicality evaluation failed: %s", e)
             return self._fallback_practicality_score(recipe)
     
+    def _evaluate_pending_nutrition(self, nutrition_future: Future) -> Dict:
+        """Wait for upstream nutrition analysis, then evaluate it like evaluate_recipe would"""
+        nutrition_data = nutrition_future.result()
+        return self._evaluate_nutrition_quality(nutrition_data) if nutrition_data else None
+    
     def _evaluate_nutrition_quality(self, nutrition_data: Dict) -> Dict:
         """Evaluate the nutritional quality of the recipe"""
         
-        print(f"⭐ Evaluating nutrition quality...")
+        logger.info("⭐ Evaluating nutrition quality...")
         
         if not nutrition_data or not nutrition_data.get('nutrition_per_serving'):
-            print(f"⚠️ No nutrition data available")
+            logger.warning("⚠️ No nutrition data available")
             return {
                 'score': 5.0,
                 'strengths': [],
@@ -404,12 +434,12 @@ Return JSON:
                 evaluation['score'] = (evaluation['score'] + existing_score) / 2
             
             score = evaluation.get('score', 5.0)
-            print(f"⭐ Nutrition: {score}/10")
+            logger.info("⭐ Nutrition: %s/10", score)
             
             return evaluation
             
         except Exception as e:
-            print(f"⚠️ Nutrition evaluation failed: {str(e)}")
+            logger.warning("⚠️ Nutrition evaluation failed: %s", e)
             return {
                 'score': existing_score,
                 'strengths': nutrition_data.get('health_insights', [])[:2],
@@ -421,7 +451,7 @@ Return JSON:
     def _evaluate_completeness(self, recipe: Dict) -> Dict:
         """Evaluate how complete and well-structured the recipe is"""
         
-        print(f"⭐ Evaluating recipe completeness...")
+        logger.info("⭐ Evaluating recipe completeness...")
         
         # Check for required fields and quality
         completeness_metrics = {
@@ -441,7 +471,7 @@ Return JSON:
         passed_checks = sum(1 for passed in completeness_metrics.values() if passed)
         completeness_score = (passed_checks / total_checks) * 10
         
-        print(f"⭐ Completeness: {completeness_score}/10 ({passed_checks}/{total_checks} checks passed)")
+        logger.info("⭐ Completeness: %s/10 (%s/%s checks passed)", completeness_score, passed_checks, total_checks)
         
         # Generate feedback
         strengths = []
@@ -532,7 +562,7 @@ Return JSON:
         total_weight = sum(weights)
         
         overall = round(weighted_sum / total_weight, 1)
-        print(f"⭐ Weighted calculation: {overall} from {len(scores)} metrics")
+        logger.info("⭐ Weighted calculation: %s from %s metrics", overall, len(scores))
         
         return overall
     
@@ -541,7 +571,7 @@ Return JSON:
                                            completeness: Dict, complexity_alignment: Dict, complexity: str) -> List[str]:
         """Generate specific recommendations for recipe improvement"""
         
-        print(f"⭐ Generating improvement recommendations for {complexity} complexity...")
+        logger.info("⭐ Generating improvement recommendations for %s complexity...", complexity)
         
         recommendations = []
         
@@ -564,7 +594,7 @@ Return JSON:
             unique_recommendations.insert(0, f"Improve practicality for {complexity} complexity level")
         
         final_recommendations = unique_recommendations[:5]  # Top 5 recommendations
-        print(f"⭐ Generated {len(final_recommendations)} recommendations")
+        logger.info("⭐ Generated %s recommendations", len(final_recommendations))
         
         return final_recommendations
     
@@ -619,12 +649,11 @@ Return JSON:
         """Extract JSON from evaluation response"""
         
         try:
-            import re
             json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
             if json_match:
                 return json.loads(json_match.group())
         except Exception as e:
-            print(f"Failed to extract evaluation JSON: {str(e)}")
+            logger.warning("⚠️ Failed to extract evaluation JSON: %s", e)
         
         return {'score': 5.0, 'confidence': 'low', 'strengths': [], 'areas_for_improvement': []}
     
@@ -691,7 +720,7 @@ Return JSON:
     def _create_fallback_evaluation(self, recipe: Dict, complexity: str) -> Dict:
         """Create fallback evaluation when main evaluation fails"""
         
-        print(f"⚠️ Using fallback evaluation for {complexity} complexity")
+        logger.warning("⚠️ Using fallback evaluation for %s complexity", complexity)
         
         return {
             'score': 5.0,
@@ -714,13 +743,13 @@ Return JSON:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 # Test the quality evaluator
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Test recipes with different complexities
     test_recipes = [
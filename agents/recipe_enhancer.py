@@ -1,17 +1,23 @@
 # agents/recipe_enhancer.py
+import logging
 import os
-from anthropic import Anthropic
+import sys
 from typing import Dict, List
 import json
 import random
 import re
 
+if __name__ == "__main__":
+    # Run directly (python agents/recipe_enhancer.py): sys.path[0] is agents/, so add the project root for tools/
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.anthropic_client import get_client
+
+logger = logging.getLogger(__name__)
+
 class RecipeEnhancer:
     def __init__(self):
-        self.client = Anthropic(
-            api_key=os.getenv('ANTHROPIC_API_KEY'),
-            timeout=60.0  # 60 second timeout for API calls
-        )
+        self.client = get_client().with_options(timeout=60.0)  # 60 second timeout for API calls
         self.model = "claude-sonnet-4-20250514"
         
         # Enhancement strategies to make recipes more interesting
@@ -33,11 +39,11 @@ class RecipeEnhancer:
         """
         
         try:
-            print(f"🔧 Enhancing recipe: {basic_recipe.get('title', 'Unknown')}")
+            logger.info("🔧 Enhancing recipe: %s", basic_recipe.get('title', 'Unknown'))
             
             # Use complexity from parameter or fall back to recipe difficulty
             target_complexity = complexity or basic_recipe.get('difficulty', 'Medium')
-            print(f"🔧 Target complexity: {target_complexity}")
+            logger.info("🔧 Target complexity: %s", target_complexity)
             
             # Choose enhancement strategies based on recipe type, inspiration, and complexity
             strategies = self._select_enhancement_strategies(basic_recipe, inspiration_data, target_complexity)
@@ -52,32 +58,32 @@ class RecipeEnhancer:
             )
             
             enhanced_text = response.content[0].text.strip()
-            print(f"📝 Claude response length: {len(enhanced_text)} characters")
+            logger.info("📝 Claude response length: %s characters", len(enhanced_text))
             
             # Enhanced JSON extraction with better error handling
             enhanced_data = self._extract_json_from_response(enhanced_text)
             
             if not enhanced_data:
-                print("⚠️ No valid JSON found, using original recipe")
+                logger.warning("⚠️ No valid JSON found, using original recipe")
                 return self._mark_enhancement_failed(basic_recipe, "No valid JSON response")
             
             validated_recipe = self._validate_enhanced_recipe(enhanced_data, basic_recipe, target_complexity)
             
-            print(f"✅ Recipe enhanced successfully: {validated_recipe.get('title', 'Unknown')}")
+            logger.info("✅ Recipe enhanced successfully: %s", validated_recipe.get('title', 'Unknown'))
             return validated_recipe
             
         except json.JSONDecodeError as e:
-            print(f"❌ JSON parsing failed: {str(e)}")
+            logger.error("❌ JSON parsing failed: %s", e)
             return self._mark_enhancement_failed(basic_recipe, f"JSON parsing error: {str(e)}")
             
         except Exception as e:
-            print(f"❌ Enhancement failed: {str(e)}")
+            logger.error("❌ Enhancement failed: %s", e)
             return self._mark_enhancement_failed(basic_recipe, str(e))
     
     def _extract_json_from_response(self, response_text: str) -> Dict:
         """Extract JSON from Claude's response with robust error handling"""
         
-        print(f"🔍 Extracting JSON from response...")
+        logger.info("🔍 Extracting JSON from response...")
         
         # Method 1: Try to find complete JSON block
         json_patterns = [
@@ -96,14 +102,14 @@ class RecipeEnhancer:
                     
                     # Validate that it looks like a recipe
                     if self._is_valid_recipe_json(parsed):
-                        print(f"✅ Valid JSON found using pattern")
+                        logger.info("✅ Valid JSON found using pattern")
                         return parsed
                         
                 except json.JSONDecodeError:
                     continue
         
         # Method 2: Try to extract individual fields if complete JSON fails
-        print("⚠️ Complete JSON extraction failed, trying field extraction...")
+        logger.warning("⚠️ Complete JSON extraction failed, trying field extraction...")
         return self._extract_recipe_fields(response_text)
     
     def _clean_json_string(self, json_str: str) -> str:
@@ -132,7 +138,7 @@ class RecipeEnhancer:
     def _extract_recipe_fields(self, text: str) -> Dict:
         """Extract recipe fields individually if JSON parsing fails"""
         
-        print("🔧 Attempting field-by-field extraction...")
+        logger.info("🔧 Attempting field-by-field extraction...")
         
         extracted = {}
         
@@ -160,10 +166,10 @@ class RecipeEnhancer:
         
         # Only return if we got essential fields
         if extracted.get('title') and (extracted.get('ingredients') or extracted.get('instructions')):
-            print(f"✅ Field extraction successful: {extracted.get('title')}")
+            logger.info("✅ Field extraction successful: %s", extracted.get('title'))
             return extracted
         
-        print("❌ Field extraction failed")
+        logger.error("❌ Field extraction failed")
         return {}
     
     def _extract_array_field(self, text: str, field_name: str) -> List[str]:
@@ -194,7 +200,7 @@ class RecipeEnhancer:
         error_recipe["enhancement_attempted"] = True
         error_recipe["enhanced"] = False
         
-        print(f"⚠️ Returning original recipe due to error: {error_message}")
+        logger.warning("⚠️ Returning original recipe due to error: %s", error_message)
         return error_recipe
     
     def _select_enhancement_strategies(self, recipe: Dict, inspiration: Dict = None, complexity: str = "Medium") -> List[str]:
@@ -217,7 +223,7 @@ class RecipeEnhancer:
         }
         target_level = complexity_map.get(complexity, "medium")
         
-        print(f"🔧 Selecting strategies for {target_level} complexity level")
+        logger.info("🔧 Selecting strategies for %s complexity level", target_level)
         
         # Always try flavor boosting for all levels
         strategies.append("flavor_boosting")
@@ -250,7 +256,7 @@ class RecipeEnhancer:
         
         # Limit to 3 strategies to avoid overwhelming changes
         selected_strategies = strategies[:3]
-        print(f"🔧 Selected strategies: {selected_strategies}")
+        logger.info("🔧 Selected strategies: %s", selected_strategies)
         
         return selected_strategies
     
@@ -460,7 +466,7 @@ Return as JSON array:
                 return json.loads(json_match.group())
             
         except Exception as e:
-            print(f"⚠️ Variations generation failed: {str(e)}")
+            logger.warning("⚠️ Variations generation failed: %s", e)
         
         # Return default variations if generation fails
         return [
@@ -476,6 +482,7 @@ Return as JSON array:
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Test data - basic recipe
     test_recipe = {
@@ -1,13 +1,22 @@
 # agents/recipe_generator.py
+import logging
 import os
-from anthropic import Anthropic
+import sys
 from typing import Dict, List
 import json
 import re
 
+if __name__ == "__main__":
+    # Run directly (python agents/recipe_generator.py): sys.path[0] is agents/, so add the project root for tools/
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.anthropic_client import get_client
+
+logger = logging.getLogger(__name__)
+
 class RecipeGenerator:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
     
     def create_recipe(self, user_request: str, complexity: str = "Medium") -> Dict:
@@ -16,7 +25,7 @@ class RecipeGenerator:
         Returns structured recipe data for web API compatibility
         """
         
-        print(f"🤖 RecipeGenerator: Creating {complexity} complexity recipe for '{user_request}'")
+        logger.info("🤖 RecipeGenerator: Creating %s complexity recipe for '%s'", complexity, user_request)
         
         # Define complexity-specific guidance
         complexity_guidance = self._get_complexity_guidance(complexity)
@@ -55,7 +64,7 @@ Make sure the JSON is valid and complete. Include realistic measurements and cle
 """
         
         try:
-            print(f"🤖 Sending prompt to Claude for {complexity} recipe...")
+            logger.info("🤖 Sending prompt to Claude for %s recipe...", complexity)
             
             response = self.client.messages.create(
                 model=self.model,
@@ -64,7 +73,7 @@ Make sure the JSON is valid and complete. Include realistic measurements and cle
             )
             
             recipe_text = response.content[0].text.strip()
-            print(f"🤖 Claude response length: {len(recipe_text)} characters")
+            logger.info("🤖 Claude response length: %s characters", len(recipe_text))
             
             # Extract JSON from the response
             recipe_data = self._extract_json_from_response(recipe_text)
@@ -72,12 +81,12 @@ Make sure the JSON is valid and complete. Include realistic measurements and cle
             # Validate and clean the recipe data
             validated_recipe = self._validate_recipe_data(recipe_data, user_request, complexity)
             
-            print(f"✅ RecipeGenerator: Successfully created '{validated_recipe.get('title')}' at {complexity} complexity")
+            logger.info("✅ RecipeGenerator: Successfully created '%s' at %s complexity", validated_recipe.get('title'), complexity)
             
             return validated_recipe
             
         except Exception as e:
-            print(f"❌ RecipeGenerator Error: {str(e)}")
+            logger.error("❌ RecipeGenerator Error: %s", e)
             # Return error in structured format
             return {
                 "error": f"Recipe generation failed: {str(e)}",
@@ -135,10 +144,10 @@ HIGH COMPLEXITY GUIDELINES:
             json_str = json_match.group()
             try:
                 extracted = json.loads(json_str)
-                print(f"🤖 Successfully extracted JSON with {len(extracted)} fields")
+                logger.info("🤖 Successfully extracted JSON with %s fields", len(extracted))
                 return extracted
             except json.JSONDecodeError as e:
-                print(f"⚠️ JSON decode error: {str(e)}")
+                logger.warning("⚠️ JSON decode error: %s", e)
                 # If JSON is malformed, try to fix common issues
                 return self._fix_malformed_json(json_str)
         
@@ -146,13 +155,13 @@ HIGH COMPLEXITY GUIDELINES:
         try:
             return json.loads(response_text)
         except:
-            print(f"❌ Could not extract valid JSON from response")
+            logger.error("❌ Could not extract valid JSON from response")
             raise Exception("Could not extract valid JSON from recipe response")
     
     def _fix_malformed_json(self, json_str: str) -> Dict:
         """Try to fix common JSON formatting issues"""
         
-        print(f"🔧 Attempting to fix malformed JSON...")
+        logger.info("🔧 Attempting to fix malformed JSON...")
         
         # Remove any trailing commas
         json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
@@ -160,16 +169,16 @@ HIGH COMPLEXITY GUIDELINES:
         # Try parsing again
         try:
             fixed = json.loads(json_str)
-            print(f"✅ Successfully fixed JSON")
+            logger.info("✅ Successfully fixed JSON")
             return fixed
         except:
-            print(f"❌ Could not fix JSON formatting")
+            logger.error("❌ Could not fix JSON formatting")
             raise Exception("Could not fix malformed JSON")
     
     def _validate_recipe_data(self, recipe_data: Dict, original_request: str, complexity: str) -> Dict:
         """Ensure recipe data has all required fields and is web-ready"""
         
-        print(f"🔍 Validating recipe data for {complexity} complexity...")
+        logger.info("🔍 Validating recipe data for %s complexity...", complexity)
         
         # Map backend complexity to frontend complexity for consistency
         frontend_complexity_mapping = {
@@ -203,30 +212,30 @@ HIGH COMPLEXITY GUIDELINES:
         # Clean and validate ingredients
         if not validated["ingredients"]:
             validated["ingredients"] = ["Ingredients need to be specified"]
-            print(f"⚠️ No ingredients found, using placeholder")
+            logger.warning("⚠️ No ingredients found, using placeholder")
         else:
-            print(f"✅ Found {len(validated['ingredients'])} ingredients")
+            logger.info("✅ Found %s ingredients", len(validated['ingredients']))
         
         # Clean and validate instructions
         if not validated["instructions"]:
             validated["instructions"] = ["Instructions need to be specified"]
-            print(f"⚠️ No instructions found, using placeholder")
+            logger.warning("⚠️ No instructions found, using placeholder")
         else:
-            print(f"✅ Found {len(validated['instructions'])} instruction steps")
+            logger.info("✅ Found %s instruction steps", len(validated['instructions']))
         
         # Ensure we have at least some tags
         if not validated["tags"]:
             frontend_complexity_tag = frontend_complexity.lower()
             validated["tags"] = ["homemade", "recipe", frontend_complexity_tag]
-            print(f"⚠️ No tags found, using defaults including '{frontend_complexity_tag}'")
+            logger.warning("⚠️ No tags found, using defaults including '%s'", frontend_complexity_tag)
         else:
             # Add complexity tag if not present
             frontend_complexity_tag = frontend_complexity.lower()
             if frontend_complexity_tag not in [tag.lower() for tag in validated["tags"]]:
                 validated["tags"].append(frontend_complexity_tag)
-            print(f"✅ Tags validated: {validated['tags']}")
+            logger.info("✅ Tags validated: %s", validated['tags'])
         
-        print(f"✅ Recipe validation complete for '{validated['title']}'")
+        logger.info("✅ Recipe validation complete for '%s'", validated['title'])
         
         return validated
     
@@ -239,7 +248,7 @@ HIGH COMPLEXITY GUIDELINES:
         if not complexity:
             complexity = original_recipe.get('requested_complexity', 'Medium')
         
-        print(f"🔄 Regenerating recipe with {complexity} complexity based on feedback")
+        logger.info("🔄 Regenerating recipe with %s complexity based on feedback", complexity)
         
         complexity_guidance = self._get_complexity_guidance(complexity)
         
@@ -262,7 +271,7 @@ Return the improved recipe in the same JSON format as before.
 """
         
         try:
-            print(f"🔄 Sending regeneration request to Claude...")
+            logger.info("🔄 Sending regeneration request to Claude...")
             
             response = self.client.messages.create(
                 model=self.model,
@@ -278,12 +287,12 @@ Return the improved recipe in the same JSON format as before.
                 complexity
             )
             
-            print(f"✅ Recipe regenerated successfully with {complexity} complexity")
+            logger.info("✅ Recipe regenerated successfully with %s complexity", complexity)
             
             return validated_recipe
             
         except Exception as e:
-            print(f"❌ Recipe regeneration failed: {str(e)}")
+            logger.error("❌ Recipe regeneration failed: %s", e)
             # Return the original recipe with error note if regeneration fails
             original_recipe["regeneration_error"] = str(e)
             return original_recipe
@@ -292,6 +301,7 @@ Return the improved recipe in the same JSON format as before.
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     generator = RecipeGenerator()
     
@@ -1,8 +1,8 @@
 # agents/web_researcher.py - Updated with real Google Search
+import logging
 import os
-import requests
+import sys
 from bs4 import BeautifulSoup
-from anthropic import Anthropic
 from typing import Dict, List
 import json
 import time
@@ -11,9 +11,18 @@ from urllib.parse import urljoin, urlparse
 import re
 from googleapiclient.discovery import build
 
+if __name__ == "__main__":
+    # Run directly (python agents/web_researcher.py): sys.path[0] is agents/, so add the project root for tools/
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.anthropic_client import get_client
+from tools.http_session import session as http_session
+
+logger = logging.getLogger(__name__)
+
 class WebResearcher:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
         
         # Google Custom Search setup
@@ -24,9 +33,9 @@ class WebResearcher:
         if self.google_api_key and self.search_engine_id:
             try:
                 self.google_service = build("customsearch", "v1", developerKey=self.google_api_key)
-                print("✅ Google Custom Search initialized")
+                logger.info("✅ Google Custom Search initialized")
             except Exception as e:
-                print(f"⚠️  Google Search setup failed: {str(e)}")
+                logger.warning("⚠️  Google Search setup failed: %s", e)
         
         # Fallback recipe sites for direct scraping
         self.recipe_sites = [
@@ -55,7 +64,7 @@ class WebResearcher:
         Search for recipe inspiration using real Google Custom Search
         """
         
-        print(f"🔍 Researching inspiration for: {recipe_title}")
+        logger.info("🔍 Researching inspiration for: %s", recipe_title)
         
         try:
             # Generate search queries
@@ -69,7 +78,7 @@ class WebResearcher:
                 inspiration_sources = self._google_search_recipes(search_queries)
             else:
                 # Fallback to direct site search
-                print("⚠️  Using fallback search (no Google API)")
+                logger.warning("⚠️  Using fallback search (no Google API)")
                 inspiration_sources = self._fallback_search(search_queries)
             
             # Process and analyze the found sources
@@ -80,7 +89,7 @@ class WebResearcher:
             return processed_inspiration
             
         except Exception as e:
-            print(f"⚠️  Web research failed: {str(e)}")
+            logger.warning("⚠️  Web research failed: %s", e)
             return self._create_fallback_inspiration(recipe_title, recipe_type)
     
     def _google_search_recipes(self, queries: List[str]) -> List[Dict]:
@@ -90,7 +99,7 @@ class WebResearcher:
         
         for query in queries[:2]:  # Limit to 2 queries
             try:
-                print(f"  🔍 Google searching: {query}")
+                logger.info("  🔍 Google searching: %s", query)
                 
                 # Execute Google Custom Search
                 result = self.google_service.cse().list(
@@ -121,7 +130,7 @@ class WebResearcher:
                 time.sleep(self.request_delay)
                 
             except Exception as e:
-                print(f"  ❌ Google search failed for '{query}': {str(e)}")
+                logger.error("  ❌ Google search failed for '%s': %s", query, e)
                 continue
         
         return sources
@@ -131,9 +140,9 @@ class WebResearcher:
         Scrape actual recipe content from a URL
         """
         try:
-            print(f"    📄 Scraping: {urlparse(url).netloc}")
+            logger.info("    📄 Scraping: %s", urlparse(url).netloc)
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -215,7 +224,7 @@ class WebResearcher:
                 return None
                 
         except Exception as e:
-            print(f"    ❌ Scraping failed for {url}: {str(e)}")
+            logger.error("    ❌ Scraping failed for %s: %s", url, e)
             return None
     
     def _fallback_search(self, queries: List[str]) -> List[Dict]:
@@ -317,7 +326,6 @@ Focus on actionable insights that could improve the original recipe. Be specific
             analysis_text = response.content[0].text.strip()
             
             # Extract JSON from response
-            import re
             json_match = re.search(r'\{.*\}', analysis_text, re.DOTALL)
             if json_match:
                 inspiration_data = json.loads(json_match.group())
@@ -328,11 +336,11 @@ Focus on actionable insights that could improve the original recipe. Be specific
                 inspiration_data['original_query'] = original_title
                 inspiration_data['real_search_used'] = bool(self.google_service)
                 
-                print(f"  ✅ Analyzed {len(sources)} real sources")
+                logger.info("  ✅ Analyzed %s real sources", len(sources))
                 return inspiration_data
         
         except Exception as e:
-            print(f"  ❌ Failed to analyze sources: {str(e)}")
+            logger.error("  ❌ Failed to analyze sources: %s", e)
         
         return self._create_fallback_inspiration(original_title)
     
@@ -367,7 +375,6 @@ Provide general cooking wisdom and enhancement ideas:
             
             fallback_text = response.content[0].text.strip()
             
-            import re
             json_match = re.search(r'\{.*\}', fallback_text, re.DOTALL)
             if json_match:
                 fallback_data = json.loads(json_match.group())
@@ -375,7 +382,7 @@ Provide general cooking wisdom and enhancement ideas:
                 return fallback_data
         
         except Exception as e:
-            print(f"Fallback inspiration failed: {str(e)}")
+            logger.warning("⚠️ Fallback inspiration failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         
         # Ultimate fallback
         return {
@@ -424,7 +431,7 @@ Provide general cooking wisdom and enhancement ideas:
                 return trending[:5]
                 
             except Exception as e:
-                print(f"Trending search failed: {str(e)}")
+                logger.warning("⚠️ Trending search failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         
         # Fallback trending data
         return [
@@ -446,6 +453,7 @@ Provide general cooking wisdom and enhancement ideas:
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     researcher = WebResearcher()
     
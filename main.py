@@ -1,20 +1,65 @@
 # main.py - Simple queue-based optimization without async complexity
+import importlib
 import os
+import re
+import sys
 import time
 import threading
 import uuid
-import traceback
 from typing import Dict, List
 from queue import Queue, Empty
 from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from enum import Enum
 import logging
 import signal
 import atexit
+from tools.log_queue import configure_logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging (queued, so request and worker threads never block on stderr)
+configure_logging()
 logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+_DIGITS = re.compile(r'\d+')
+
+def normalize_request(user_request: str) -> str:
+    """Case- and whitespace-insensitive form of a recipe request (matches recipes.request_norm)"""
+    return _WHITESPACE.sub(' ', user_request.strip().lower())
+
+def _request_key(user_request: str, complexity: str) -> tuple:
+    """Identity of a recipe request: normalized text plus complexity"""
+    return (normalize_request(user_request), complexity)
+
+# Per-serving estimates used when nutrition analysis fails, by meal type
+_FALLBACK_NUTRITION_BY_MEAL = {
+    'breakfast': {'calories': 350, 'protein': 15, 'carbs': 45, 'fat': 12},
+    'lunch': {'calories': 450, 'protein': 20, 'carbs': 50, 'fat': 15},
+    'dinner': {'calories': 550, 'protein': 25, 'carbs': 55, 'fat': 18},
+    'snack': {'calories': 200, 'protein': 8, 'carbs': 25, 'fat': 8},
+    'dessert': {'calories': 300, 'protein': 5, 'carbs': 45, 'fat': 12}
+}
+
+# Agents live in ./agents and import each other by bare module name
+_AGENTS_PATH = os.path.join(os.path.dirname(__file__), 'agents')
+if _AGENTS_PATH not in sys.path:
+    sys.path.insert(0, _AGENTS_PATH)
+
+def _import_agent(module_name: str, class_name: str):
+    """Agent class, or None if its module fails to import (the pipeline then uses its fallbacks)"""
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except Exception as e:
+        logger.warning("⚠️ %s unavailable: %s", class_name, e)
+        return None
+
+RecipeGenerator = _import_agent('recipe_generator', 'RecipeGenerator')
+RecipeEnhancer = _import_agent('recipe_enhancer', 'RecipeEnhancer')
+NutritionAnalyst = _import_agent('nutrition_analyst', 'NutritionAnalyst')
+QualityEvaluator = _import_agent('quality_evaluator', 'QualityEvaluator')
+
 class TaskStatus(Enum):
     QUEUED = "queued"
     PROCESSING = "processing"
@@ -35,21 +80,31 @@ class RecipeTask:
 class SimpleRecipeQueue:
     def __init__(self, max_concurrent=2):
         self.tasks = {}
+        self.task_ids_by_request = {}  # _request_key -> task_id of the latest task for that request
+        self.status_counts = Counter()  # TaskStatus -> number of tasks in self.tasks
         self.queue = Queue(maxsize=50)
         self.processing_count = 0
         self.max_concurrent = max_concurrent
         self.lock = threading.Lock()
+        # One slot per concurrent task; released by the processing thread when it finishes
+        self.capacity = threading.Semaphore(max_concurrent)
         self.worker_thread = None
         self.running = True
         self.startup_complete = False
+        # Last lock-guarded counts seen by health_snapshot(), reused when the lock is busy
+        self._last_counts = {'processing_count': 0, 'total_tasks': 0, 'tasks_by_status': {}}
+        
+        # Optional callback(task, result) run on the processing thread before a task is marked completed
+        self.on_task_complete = None
         
         # ADD: Task retention settings
         self.task_retention_time = 1800  # Keep completed tasks for 30 minutes
         self.last_cleanup = time.time()
         self.cleanup_interval = 600  # Run cleanup every 10 minutes
+        self.max_retained_tasks = 1000  # Finished tasks beyond this are evicted oldest-first
         
-        logger.info(f"🚀 Initializing queue with max_concurrent={max_concurrent}")
-        logger.info(f"🕐 Task retention: {self.task_retention_time}s, cleanup interval: {self.cleanup_interval}s")
+        logger.info("🚀 Initializing queue with max_concurrent=%s", max_concurrent)
+        logger.info("🕐 Task retention: %ss, cleanup interval: %ss", self.task_retention_time, self.cleanup_interval)
         
         # Setup graceful shutdown handlers
         self._setup_graceful_shutdown()
@@ -57,6 +112,66 @@ class SimpleRecipeQueue:
         # DON'T start worker immediately - wait for first request to avoid startup race condition
         logger.info("⏰ Queue initialized, worker will start on first request")
         
+    def _set_task_status(self, task: RecipeTask, status: TaskStatus):
+        """Transition a stored task, keeping status_counts in step (caller holds self.lock)"""
+        self.status_counts[task.status] -= 1
+        self.status_counts[status] += 1
+        task.status = status
+    
+    @staticmethod
+    def _is_reusable(task: RecipeTask) -> bool:
+        """Whether an identical request may share this task: not failed, and not a placeholder fallback recipe"""
+        if task.status == TaskStatus.FAILED:
+            return False
+        return not (task.status == TaskStatus.COMPLETED and (task.result or {}).get('fallback_used'))
+    
+    def has_reusable_task(self, user_request: str, complexity: str) -> bool:
+        """Whether add_task would hand this request an existing retained task"""
+        if not self.lock.acquire(timeout=1.0):
+            return False
+        try:
+            existing = self.tasks.get(self.task_ids_by_request.get(_request_key(user_request, complexity)))
+            return existing is not None and self._is_reusable(existing)
+        finally:
+            self.lock.release()
+    
+    def status_counts_snapshot(self) -> Dict:
+        """Task counts keyed by status value (caller holds self.lock)"""
+        return {status.value: count for status, count in self.status_counts.items() if count > 0}
+    
+    def health_snapshot(self) -> Dict:
+        """Queue stats and worker diagnostics for health probes; never waits on self.lock"""
+        if self.lock.acquire(blocking=False):
+            try:
+                self._last_counts = {
+                    'processing_count': self.processing_count,
+                    'total_tasks': len(self.tasks),
+                    'tasks_by_status': self.status_counts_snapshot()
+                }
+            finally:
+                self.lock.release()
+            stale = False
+        else:
+            stale = True  # Dispatch holds the lock; report the previous counts instead of queueing behind it
+        
+        counts = self._last_counts
+        worker = self.worker_thread
+        return {
+            'queue_stats': {
+                'processing_count': counts['processing_count'],
+                'max_concurrent': self.max_concurrent,
+                'total_tasks': counts['total_tasks'],
+                'queue_size': self.queue.qsize(),
+                'counts_stale': stale
+            },
+            'worker_diagnostics': {
+                'worker_thread_exists': worker is not None,
+                'worker_thread_alive': worker.is_alive() if worker else False,
+                'worker_running_flag': self.running,
+                'tasks_by_status': counts['tasks_by_status']
+            }
+        }
+    
     def _ensure_worker_started(self):
         """Ensure worker is started when needed (lazy startup to avoid race conditions)"""
         if not self.startup_complete:
@@ -76,20 +191,16 @@ class SimpleRecipeQueue:
             
             while self.running:
                 try:
-                    # Check if we can process more tasks
-                    with self.lock:
-                        current_processing = self.processing_count
-                    
-                    if current_processing >= self.max_concurrent:
-                        logger.debug(f"🔄 At max capacity ({current_processing}/{self.max_concurrent})")
-                        time.sleep(1)
+                    # Wait for a free slot - wakes as soon as a running task finishes
+                    if not self.capacity.acquire(timeout=1):
                         continue
                     
                     # Get next task
                     try:
                         task = self.queue.get(timeout=1)
-                        logger.info(f"🎯 Worker got task: {task.task_id}")
+                        logger.info("🎯 Worker got task: %s", task.task_id)
                     except Empty:
+                        self.capacity.release()
                         continue
                     
                     # Process in separate thread to maintain concurrency
@@ -101,17 +212,17 @@ class SimpleRecipeQueue:
                             name=f"RecipeProcessor-{task.task_id[:8]}"
                         )
                         process_thread.start()
-                        logger.info(f"🚀 Started processing thread for {task.task_id}")
+                        logger.info("🚀 Started processing thread for %s", task.task_id)
                     except Exception as thread_error:
-                        logger.error(f"❌ Failed to start processing thread: {str(thread_error)}")
+                        logger.error("❌ Failed to start processing thread: %s", thread_error)
+                        self.capacity.release()
                         # Mark task as failed if we can't start processing thread
                         with self.lock:
-                            task.status = TaskStatus.FAILED
+                            self._set_task_status(task, TaskStatus.FAILED)
                             task.error = f"Failed to start processing: {str(thread_error)}"
                     
                 except Exception as e:
-                    logger.error(f"❌ Worker loop error: {str(e)}")
-                    logger.error(traceback.format_exc())
+                    logger.exception("❌ Worker loop error: %s", e)
                     # Don't crash the worker, just wait and continue
                     time.sleep(5)
             
@@ -125,16 +236,14 @@ class SimpleRecipeQueue:
             )
             self.worker_thread.start()
             
-            # Verify the thread started successfully
-            time.sleep(0.1)
+            # Verify the thread started successfully (start() already blocks until it runs)
             if self.worker_thread.is_alive():
                 logger.info("✅ Delayed queue worker started successfully")
             else:
                 logger.error("❌ Delayed queue worker failed to start")
                 
         except Exception as e:
-            logger.error(f"❌ Failed to create delayed worker thread: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ Failed to create delayed worker thread: %s", e)
     
 
     def _cleanup_old_tasks(self):
@@ -142,8 +251,9 @@ class SimpleRecipeQueue:
         
         current_time = time.time()
         
-        # Only run cleanup periodically
-        if current_time - self.last_cleanup < self.cleanup_interval:
+        # Only run cleanup periodically, or early once too many tasks are retained
+        if (current_time - self.last_cleanup < self.cleanup_interval and
+                len(self.tasks) <= self.max_retained_tasks):
             return
         
         try:
@@ -168,18 +278,33 @@ class SimpleRecipeQueue:
                         
                         if task_age_since_completion > self.task_retention_time:
                             tasks_to_remove.append(task_id)
-                            logger.debug(f"🧹 Marking task {task_id} for cleanup (age: {task_age_since_completion:.1f}s)")
+                            logger.debug("🧹 Marking task %s for cleanup (age: %.1fs)", task_id, task_age_since_completion)
+                
+                # Enforce the size cap by evicting the oldest finished tasks still retained
+                excess = len(self.tasks) - len(tasks_to_remove) - self.max_retained_tasks
+                if excess > 0:
+                    marked = set(tasks_to_remove)
+                    finished = sorted(
+                        (task for task_id, task in self.tasks.items()
+                         if task_id not in marked and task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]),
+                        key=lambda task: getattr(task, 'completion_time', task.created_at)
+                    )
+                    tasks_to_remove.extend(task.task_id for task in finished[:excess])
                 
                 # Remove old tasks
                 removed_count = 0
                 for task_id in tasks_to_remove:
                     if task_id in self.tasks:
-                        del self.tasks[task_id]
+                        task = self.tasks.pop(task_id)
+                        self.status_counts[task.status] -= 1
+                        request_key = _request_key(task.user_request, task.complexity)
+                        if self.task_ids_by_request.get(request_key) == task_id:
+                            del self.task_ids_by_request[request_key]
                         removed_count += 1
-                        logger.debug(f"🧹 Cleaned up old task: {task_id}")
+                        logger.debug("🧹 Cleaned up old task: %s", task_id)
                 
                 if removed_count > 0:
-                    logger.info(f"🧹 Cleaned up {removed_count} old tasks. Remaining: {len(self.tasks)}")
+                    logger.info("🧹 Cleaned up %s old tasks. Remaining: %s", removed_count, len(self.tasks))
                 
                 self.last_cleanup = current_time
                 
@@ -187,7 +312,7 @@ class SimpleRecipeQueue:
                 self.lock.release()
                 
         except Exception as e:
-            logger.error(f"❌ Task cleanup failed: {str(e)}")
+            logger.error("❌ Task cleanup failed: %s", e)
             
     def add_task(self, user_request: str, complexity: str) -> str:
         """Add task to queue with timeout protection"""
@@ -195,8 +320,11 @@ class SimpleRecipeQueue:
         # Ensure worker is running before adding tasks (lazy startup)
         self._ensure_worker_started()
         
+        # Submissions drive cleanup too, so retention holds even if nobody polls
+        self._cleanup_old_tasks()
+        
         task_id = str(uuid.uuid4())
-        logger.info(f"🎯 Creating task {task_id} for '{user_request}' ({complexity})")
+        logger.info("🎯 Creating task %s for '%s' (%s)", task_id, user_request, complexity)
         
         task = RecipeTask(
             task_id=task_id,
@@ -211,38 +339,49 @@ class SimpleRecipeQueue:
             # SAFE: Use timeout on lock acquisition to prevent deadlock
             lock_acquired = self.lock.acquire(timeout=5.0)  # 5 second timeout
             if not lock_acquired:
-                logger.error(f"❌ Lock timeout adding task {task_id}")
+                logger.error("❌ Lock timeout adding task %s", task_id)
                 task.status = TaskStatus.FAILED
                 task.error = "System busy, please try again"
                 # Store failed task without lock
                 self.tasks[task_id] = task
+                self.status_counts[TaskStatus.FAILED] += 1
                 return task_id
             
             try:
+                # Identical requests share one task while it is retained, unless it failed or fell back
+                request_key = _request_key(user_request, complexity)
+                existing = self.tasks.get(self.task_ids_by_request.get(request_key))
+                if existing and self._is_reusable(existing):
+                    logger.info("♻️ Reusing task %s (%s) for '%s'", existing.task_id, existing.status.value, user_request)
+                    return existing.task_id
+                
                 # Store task while holding lock
                 self.tasks[task_id] = task
+                self.task_ids_by_request[request_key] = task_id
+                self.status_counts[TaskStatus.QUEUED] += 1
                 task_count = len(self.tasks)
-                logger.info(f"✅ Task {task_id} stored. Total tasks: {task_count}")
+                logger.info("✅ Task %s stored. Total tasks: %s", task_id, task_count)
             finally:
                 self.lock.release()
             
             # Add to processing queue (this is thread-safe on its own)
             try:
                 self.queue.put(task, timeout=1)
-                logger.info(f"✅ Task {task_id} queued. Queue size: {self.queue.qsize()}")
+                logger.info("✅ Task %s queued. Queue size: %s", task_id, self.queue.qsize())
             except:
-                logger.error(f"❌ Queue full for task {task_id}")
+                logger.error("❌ Queue full for task %s", task_id)
                 # Mark as failed but keep in tasks dict
-                with self.lock.acquire(timeout=2.0):
-                    if self.lock.acquire(timeout=2.0):
-                        task.status = TaskStatus.FAILED
+                if self.lock.acquire(timeout=2.0):
+                    try:
+                        self._set_task_status(task, TaskStatus.FAILED)
                         task.error = "Queue full"
+                    finally:
                         self.lock.release()
             
             return task_id
             
         except Exception as e:
-            logger.error(f"❌ Exception adding task {task_id}: {str(e)}")
+            logger.error("❌ Exception adding task %s: %s", task_id, e)
             return task_id
 
     def get_task_status(self, task_id: str) -> Dict:
@@ -255,13 +394,13 @@ class SimpleRecipeQueue:
             # SAFE: Use timeout on lock acquisition
             lock_acquired = self.lock.acquire(timeout=3.0)
             if not lock_acquired:
-                logger.error(f"❌ Lock timeout getting status for {task_id}")
+                logger.error("❌ Lock timeout getting status for %s", task_id)
                 return {"error": "System busy, please try again"}
             
             try:
                 task = self.tasks.get(task_id)
                 if not task:
-                    logger.warning(f"⚠️ Task not found: {task_id}")
+                    logger.warning("⚠️ Task not found: %s", task_id)
                     return {"error": "Task not found"}
                 
                 # Copy task data while holding lock
@@ -287,12 +426,12 @@ class SimpleRecipeQueue:
                 if task.status == TaskStatus.COMPLETED:
                     completion_time = getattr(task, 'completion_time', task.created_at)
                     age_since_completion = time.time() - completion_time
-                    logger.debug(f"📊 Completed task {task_id} age: {age_since_completion:.1f}s (retention: {self.task_retention_time}s)")
+                    logger.debug("📊 Completed task %s age: %.1fs (retention: %ss)", task_id, age_since_completion, self.task_retention_time)
                 
                 # DEBUG: Log task age for processing tasks
                 if task.status == TaskStatus.PROCESSING:
                     task_age = time.time() - task.created_at
-                    logger.debug(f"📊 Processing task {task_id} age: {task_age:.1f}s")
+                    logger.debug("📊 Processing task %s age: %.1fs", task_id, task_age)
                     
                 return task_data
                 
@@ -300,7 +439,7 @@ class SimpleRecipeQueue:
                 self.lock.release()
                 
         except Exception as e:
-            logger.error(f"❌ Exception getting status for {task_id}: {str(e)}")
+            logger.error("❌ Exception getting status for %s: %s", task_id, e)
             return {"error": f"Status check failed: {str(e)}"}
         
     
@@ -326,26 +465,33 @@ class SimpleRecipeQueue:
             # SAFE: Update processing count with timeout
             lock_acquired = self.lock.acquire(timeout=5.0)
             if not lock_acquired:
-                logger.error(f"❌ [{thread_name}] Lock timeout starting task {task.task_id}")
+                logger.error("❌ [%s] Lock timeout starting task %s", thread_name, task.task_id)
                 return
             
             try:
                 self.processing_count += 1
-                task.status = TaskStatus.PROCESSING
+                self._set_task_status(task, TaskStatus.PROCESSING)
                 task.progress = {"step": "processing", "message": "Starting recipe generation..."}
             finally:
                 self.lock.release()
             
-            logger.info(f"🎯 [{thread_name}] Processing task: {task.task_id}")
+            logger.info("🎯 [%s] Processing task: %s", thread_name, task.task_id)
             
             # Run pipeline without holding locks
             result = self._run_minimal_pipeline(task)  # ← FIXED: result is defined here
             
+            # Persist (or otherwise hand off) the result before pollers can see it as completed
+            if self.on_task_complete:
+                try:
+                    self.on_task_complete(task, result)
+                except Exception as hook_error:
+                    logger.error("❌ [%s] Completion handler failed for %s: %s", thread_name, task.task_id, hook_error)
+            
             # SAFE: Update completion with timeout
             lock_acquired = self.lock.acquire(timeout=5.0)
             if lock_acquired:
                 try:
-                    task.status = TaskStatus.COMPLETED
+                    self._set_task_status(task, TaskStatus.COMPLETED)
                     task.result = result  # ← FIXED: Now result is in scope
                     task.progress = {"step": "completed", "message": "Recipe generation complete!"}
                     # ADD: Track completion time for cleanup
@@ -353,16 +499,16 @@ class SimpleRecipeQueue:
                 finally:
                     self.lock.release()
             
-            logger.info(f"✅ [{thread_name}] Task completed: {task.task_id}")
+            logger.info("✅ [%s] Task completed: %s", thread_name, task.task_id)
             
         except Exception as e:
-            logger.error(f"❌ [{thread_name}] Task failed: {task.task_id} - {str(e)}")
+            logger.error("❌ [%s] Task failed: %s - %s", thread_name, task.task_id, e)
             
             # SAFE: Mark as failed with timeout
             lock_acquired = self.lock.acquire(timeout=3.0)
             if lock_acquired:
                 try:
-                    task.status = TaskStatus.FAILED
+                    self._set_task_status(task, TaskStatus.FAILED)
                     task.error = str(e)
                     task.progress = {"step": "failed", "message": f"Processing failed: {str(e)}"}
                     # ADD: Track completion time for cleanup (even for failures)
@@ -379,7 +525,8 @@ class SimpleRecipeQueue:
                 finally:
                     self.lock.release()
             
-            logger.info(f"🔄 [{thread_name}] Processing count decremented for {task.task_id}")
+            self.capacity.release()
+            logger.info("🔄 [%s] Processing count decremented for %s", thread_name, task.task_id)
             
     
     def _run_minimal_pipeline(self, task):
@@ -389,21 +536,10 @@ class SimpleRecipeQueue:
         
         # Try to use agents, but fall back to basic generation if imports fail
         try:
-            # Try importing in the safest way possible
-            import sys
-            import os
-            
-            # Ensure agents directory is in path
-            agents_path = os.path.join(os.path.dirname(__file__), 'agents')
-            if agents_path not in sys.path:
-                sys.path.insert(0, agents_path)
-            
-            # Try to import and use RecipeGenerator
-            from recipe_generator import RecipeGenerator
+            if RecipeGenerator is None:
+                raise ImportError("RecipeGenerator is not available")
             generator = RecipeGenerator()
             
-            logger.info("✅ Generator imported successfully")
-            
             # Generate base recipe
             task.progress = {"step": "generating", "message": "🤖 Creating recipe..."}
             base_recipe = generator.create_recipe(task.user_request, task.complexity)
@@ -411,38 +547,38 @@ class SimpleRecipeQueue:
             if not base_recipe.get('success'):
                 raise Exception("Generator failed")
             
-            logger.info(f"✅ Generated: {base_recipe.get('title', 'Unknown')}")
+            logger.info("✅ Generated: %s", base_recipe.get('title', 'Unknown'))
             
             # Try enhancement if possible
+            task.progress = {"step": "enhancing", "message": "✨ Enhancing recipe..."}
             try:
-                from recipe_enhancer import RecipeEnhancer
+                if RecipeEnhancer is None:
+                    raise ImportError("RecipeEnhancer is not available")
                 enhancer = RecipeEnhancer()
                 enhanced_recipe = enhancer.enhance_recipe(base_recipe, None, task.complexity)
                 logger.info("✅ Enhancement successful")
             except Exception as e:
-                logger.warning(f"⚠️ Enhancement failed, using base recipe: {str(e)}")
+                logger.warning("⚠️ Enhancement failed, using base recipe: %s", e)
                 enhanced_recipe = base_recipe
             
-            # Try other agents with fallbacks
-            nutrition_data = None
-            try:
-                from nutrition_analyst import NutritionAnalyst
-                analyst = NutritionAnalyst()
-                nutrition_data = analyst.analyze_nutrition(enhanced_recipe)
-                logger.info("✅ Nutrition analysis successful")
-            except Exception as e:
-                logger.warning(f"⚠️ Nutrition analysis failed: {str(e)}")
-                nutrition_data = self._create_fallback_nutrition(enhanced_recipe)
-            
-            quality_data = None
-            try:
-                from quality_evaluator import QualityEvaluator
-                evaluator = QualityEvaluator()
-                quality_data = evaluator.evaluate_recipe(enhanced_recipe, nutrition_data, None, task.complexity)
-                logger.info("✅ Quality evaluation successful")
-            except Exception as e:
-                logger.warning(f"⚠️ Quality evaluation failed: {str(e)}")
-                quality_data = self._create_fallback_quality()
+            # Nutrition analysis and the recipe-only quality checks are independent, so
+            # analyse nutrition on a side thread; the evaluator waits on it only for its nutrition check
+            task.progress = {"step": "evaluating", "message": "📊 Analyzing nutrition and quality..."}
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                nutrition_future = executor.submit(self._analyze_nutrition, enhanced_recipe)
+                
+                quality_data = None
+                try:
+                    if QualityEvaluator is None:
+                        raise ImportError("QualityEvaluator is not available")
+                    evaluator = QualityEvaluator()
+                    quality_data = evaluator.evaluate_recipe(enhanced_recipe, nutrition_future, None, task.complexity)
+                    logger.info("✅ Quality evaluation successful")
+                except Exception as e:
+                    logger.warning("⚠️ Quality evaluation failed: %s", e)
+                    quality_data = self._create_fallback_quality()
+                
+                nutrition_data = nutrition_future.result()
             
             # Create result
             result = {
@@ -459,8 +595,7 @@ class SimpleRecipeQueue:
             return result
             
         except Exception as e:
-            logger.error(f"❌ Full pipeline failed: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("❌ Full pipeline failed: %s", e)
             
             # Ultimate fallback - create a basic recipe without any agents
             return {
@@ -497,20 +632,26 @@ class SimpleRecipeQueue:
                 'error_handled': str(e)
             }
     
+    def _analyze_nutrition(self, recipe: Dict) -> Dict:
+        """Nutrition analysis for the pipeline, falling back to estimates if the analyst fails"""
+        try:
+            if NutritionAnalyst is None:
+                raise ImportError("NutritionAnalyst is not available")
+            analyst = NutritionAnalyst()
+            nutrition_data = analyst.analyze_nutrition(recipe)
+            logger.info("✅ Nutrition analysis successful")
+            return nutrition_data
+        except Exception as e:
+            logger.warning("⚠️ Nutrition analysis failed: %s", e)
+            return self._create_fallback_nutrition(recipe)
+    
     def _create_fallback_nutrition(self, recipe: Dict) -> Dict:
         """Create basic nutrition estimates when analysis fails"""
         meal_type = recipe.get('meal_type', 'dinner').lower()
         
-        base_estimates = {
-            'breakfast': {'calories': 350, 'protein': 15, 'carbs': 45, 'fat': 12},
-            'lunch': {'calories': 450, 'protein': 20, 'carbs': 50, 'fat': 15},
-            'dinner': {'calories': 550, 'protein': 25, 'carbs': 55, 'fat': 18},
-            'snack': {'calories': 200, 'protein': 8, 'carbs': 25, 'fat': 8},
-            'dessert': {'calories': 300, 'protein': 5, 'carbs': 45, 'fat': 12}
-        }
-        
-        estimate = base_estimates.get(meal_type, base_estimates['dinner']).copy()
-        estimate.update({'fiber': 4, 'sugar': 8, 'sodium': 400})
+        # Fresh dict per call - the result is returned to clients and stored with the recipe
+        estimate = {**_FALLBACK_NUTRITION_BY_MEAL.get(meal_type, _FALLBACK_NUTRITION_BY_MEAL['dinner']),
+                    'fiber': 4, 'sugar': 8, 'sodium': 400}
         
         return {
             'nutrition_per_serving': estimate,
@@ -543,16 +684,14 @@ class SimpleRecipeQueue:
     
     def _parse_servings(self, servings_str: str) -> int:
         """Parse servings string to get number"""
-        import re
         try:
-            numbers = re.findall(r'\d+', str(servings_str))
+            numbers = _DIGITS.findall(str(servings_str))
             return int(numbers[0]) if numbers else 4
         except:
             return 4
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_queue_stats(self) -> Dict:
@@ -583,24 +722,20 @@ class SimpleRecipeQueue:
                     'queue_size': self.queue.qsize(),
                     'worker_alive': self.worker_thread.is_alive() if self.worker_thread else False,
                     'startup_complete': self.startup_complete,
-                    'tasks_by_status': {},
+                    'tasks_by_status': self.status_counts_snapshot(),
                     # ADD: Task retention info
                     'task_retention_minutes': self.task_retention_time / 60,
+                    'max_retained_tasks': self.max_retained_tasks,
                     'last_cleanup_ago': int(time.time() - self.last_cleanup)
                 }
                 
-                # Count tasks by status
-                for task in self.tasks.values():
-                    status = task.status.value
-                    stats['tasks_by_status'][status] = stats['tasks_by_status'].get(status, 0) + 1
-                
                 return stats
                 
             finally:
                 self.lock.release()
                 
         except Exception as e:
-            logger.error(f"❌ Exception getting queue stats: {str(e)}")
+            logger.error("❌ Exception getting queue stats: %s", e)
             return {'error': str(e)}
         
             
@@ -620,7 +755,7 @@ class SimpleRecipeQueue:
             signal.signal(signal.SIGINT, shutdown_handler)
             atexit.register(shutdown_handler)
         except Exception as e:
-            logger.warning(f"⚠️ Could not setup signal handlers: {str(e)}")
+            logger.warning("⚠️ Could not setup signal handlers: %s", e)
     
     def restart_worker(self):
         """Restart the worker thread (for debugging/recovery)"""
@@ -655,28 +790,32 @@ class RecipeAgentTeam:
     def __init__(self):
         """Initialize the recipe agent team with simple queue management"""
         
-        print("🚀 Initializing Recipe Agent Team with queue management...")
+        logger.info("🚀 Initializing Recipe Agent Team with queue management...")
         
         # Initialize queue
         self.queue = SimpleRecipeQueue(max_concurrent=2)  # Conservative limit
         
-        print("✅ Recipe Agent Team initialized successfully!")
+        logger.info("✅ Recipe Agent Team initialized successfully!")
     
     def queue_recipe_generation(self, user_request: str, complexity: str = "Medium") -> str:
         """Queue a recipe generation request and return task ID"""
         task_id = self.queue.add_task(user_request, complexity)
-        print(f"🎯 Recipe queued: {task_id} for '{user_request}' ({complexity})")
+        logger.info("🎯 Recipe queued: %s for '%s' (%s)", task_id, user_request, complexity)
         return task_id
     
     def get_recipe_status(self, task_id: str) -> Dict:
         """Get status of queued/processing recipe"""
         return self.queue.get_task_status(task_id)
     
+    def set_completion_handler(self, handler):
+        """Register handler(task, result), called once per successfully processed task"""
+        self.queue.on_task_complete = handler
+    
     def generate_recipe(self, user_request: str, complexity: str = "Medium") -> Dict:
         """
         Legacy synchronous method for backward compatibility
         """
-        print(f"🎯 Synchronous recipe generation for: '{user_request}' (Complexity: {complexity})")
+        logger.info("🎯 Synchronous recipe generation for: '%s' (Complexity: %s)", user_request, complexity)
         
         # For immediate/synchronous requests, create a simple task and process directly
         task = RecipeTask(
@@ -689,26 +828,13 @@ class RecipeAgentTeam:
         )
         
         try:
-            # Import agents
-            from recipe_generator import RecipeGenerator
-            from recipe_enhancer import RecipeEnhancer
-            from web_researcher import WebResearcher
-            from nutrition_analyst import NutritionAnalyst
-            from quality_evaluator import QualityEvaluator
-            
-            generator = RecipeGenerator()
-            enhancer = RecipeEnhancer()
-            researcher = WebResearcher()
-            nutrition_analyst = NutritionAnalyst()
-            quality_evaluator = QualityEvaluator()
-            
             # Process directly
             result = self.queue._run_minimal_pipeline(task)
             
             return result
             
         except Exception as e:
-            print(f"❌ Synchronous generation failed: {str(e)}")
+            logger.error("❌ Synchronous generation failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
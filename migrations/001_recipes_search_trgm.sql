@@ -0,0 +1,9 @@
+-- Trigram indexes so the /api/recipes search (title/description ILIKE '%term%')
+-- is an index scan instead of a sequential scan over every recipe.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS recipes_title_trgm
+    ON recipes USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS recipes_description_trgm
+    ON recipes USING gin (description gin_trgm_ops);
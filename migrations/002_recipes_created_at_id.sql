@@ -0,0 +1,4 @@
+-- Composite index backing keyset pagination on /api/recipes
+-- (ORDER BY created_at DESC, id DESC with a (created_at, id) cursor).
+CREATE INDEX IF NOT EXISTS recipes_created_at_id
+    ON recipes (created_at DESC, id DESC);
@@ -0,0 +1,5 @@
+-- Filtered listing on /api/recipes (meal_type and/or difficulty equality filters,
+-- ORDER BY created_at DESC, id DESC LIMIT n) reads the newest matching rows
+-- straight from this index instead of scanning and sorting the filtered set.
+CREATE INDEX IF NOT EXISTS recipes_meal_type_difficulty_created_at
+    ON recipes (meal_type, difficulty, created_at DESC, id DESC);
@@ -0,0 +1,10 @@
+-- Fail fast instead of letting a runaway query hold a PostgREST pool connection.
+-- The app talks to PostgREST with the anon key; authenticated gets a little more room.
+ALTER ROLE anon SET statement_timeout = '2s';
+ALTER ROLE authenticated SET statement_timeout = '3s';
+
+ALTER ROLE anon SET idle_in_transaction_session_timeout = '5s';
+ALTER ROLE authenticated SET idle_in_transaction_session_timeout = '5s';
+
+-- PostgREST applies per-role settings after a config reload
+NOTIFY pgrst, 'reload config';
@@ -0,0 +1,10 @@
+-- Normalized request text (lowercased, whitespace collapsed - same as main.normalize_request)
+-- so /api/generate-recipe can serve an already saved recipe instead of re-running the agents.
+ALTER TABLE recipes
+    ADD COLUMN IF NOT EXISTS request_norm text
+    GENERATED ALWAYS AS (lower(btrim(regexp_replace(original_request, '\s+', ' ', 'g')))) STORED;
+
+-- Not UNIQUE: existing history may already hold repeats, and two identical requests
+-- racing through generation should both save rather than fail the second insert.
+CREATE INDEX IF NOT EXISTS recipes_request_norm_difficulty
+    ON recipes (request_norm, difficulty, created_at DESC);
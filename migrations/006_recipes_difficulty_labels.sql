@@ -0,0 +1,5 @@
+-- Queued saves used to store the agent complexity level (Easy/High) in difficulty while
+-- synchronous saves stored the frontend label (Simple/Gourmet). Both now store the label;
+-- relabel older rows so the list filter and the saved-recipe lookup match them too.
+UPDATE recipes SET difficulty = 'Simple' WHERE difficulty = 'Easy';
+UPDATE recipes SET difficulty = 'Gourmet' WHERE difficulty = 'High';
@@ -0,0 +1,6 @@
+-- Placeholder recipes from the agent-less fallback ("Basic <request>", "A simple <request>
+-- recipe") used to be saved like real ones, and the saved-recipe lookup on
+-- /api/generate-recipe would keep serving them. They are no longer saved; remove the old ones.
+DELETE FROM recipes
+WHERE description = 'A simple ' || original_request || ' recipe'
+  AND cuisine_type = 'Various';
@@ -0,0 +1,110 @@
+# test_queue.py - SimpleRecipeQueue dedup, status bookkeeping and retention (no worker thread, no agents)
+import time
+
+import pytest
+
+from main import SimpleRecipeQueue, TaskStatus, normalize_request
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    # Tasks only need to be stored and queued here - keep the worker and signal handlers out of it
+    monkeypatch.setattr(SimpleRecipeQueue, '_setup_graceful_shutdown', lambda self: None)
+    monkeypatch.setattr(SimpleRecipeQueue, '_ensure_worker_started', lambda self: None)
+    return SimpleRecipeQueue()
+
+
+def finish(queue, task_id, status=TaskStatus.COMPLETED, result=None, completed_at=None):
+    """Move a stored task to a finished status the way the processing thread does"""
+    task = queue.tasks[task_id]
+    with queue.lock:
+        queue._set_task_status(task, status)
+        task.result = result
+        task.completion_time = time.time() if completed_at is None else completed_at
+    return task
+
+
+def test_normalize_request_ignores_case_and_whitespace():
+    assert normalize_request('  Chicken \t  TACOS\n') == 'chicken tacos'
+
+
+def test_identical_request_reuses_queued_task(queue):
+    first = queue.add_task('chicken tacos', 'Medium')
+
+    assert queue.add_task('  Chicken   Tacos ', 'Medium') == first
+    assert len(queue.tasks) == 1
+    assert queue.has_reusable_task('chicken tacos', 'Medium')
+
+
+def test_different_complexity_gets_its_own_task(queue):
+    first = queue.add_task('chicken tacos', 'Medium')
+
+    assert queue.add_task('chicken tacos', 'High') != first
+    assert len(queue.tasks) == 2
+
+
+def test_completed_task_is_reused(queue):
+    first = queue.add_task('chicken tacos', 'Medium')
+    finish(queue, first, result={'success': True, 'recipe': {'title': 'Chicken Tacos'}})
+
+    assert queue.add_task('chicken tacos', 'Medium') == first
+
+
+def test_failed_task_is_not_reused(queue):
+    first = queue.add_task('chicken tacos', 'Medium')
+    finish(queue, first, TaskStatus.FAILED)
+
+    assert not queue.has_reusable_task('chicken tacos', 'Medium')
+    second = queue.add_task('chicken tacos', 'Medium')
+    assert second != first
+    assert queue.task_ids_by_request[('chicken tacos', 'Medium')] == second
+
+
+def test_completed_fallback_task_is_not_reused(queue):
+    first = queue.add_task('chicken tacos', 'Medium')
+    finish(queue, first, result={'success': True, 'fallback_used': True, 'recipe': {'title': 'Basic Chicken Tacos'}})
+
+    assert not queue.has_reusable_task('chicken tacos', 'Medium')
+    second = queue.add_task('chicken tacos', 'Medium')
+    assert second != first
+    assert queue.task_ids_by_request[('chicken tacos', 'Medium')] == second
+
+
+def test_status_counts_follow_transitions(queue):
+    first = queue.add_task('chicken tacos', 'Medium')
+    queue.add_task('chicken tacos', 'Medium')  # Reused - must not be counted twice
+    queue.add_task('veggie curry', 'Easy')
+
+    assert queue.status_counts_snapshot() == {'queued': 2}
+
+    finish(queue, first)
+    assert queue.status_counts_snapshot() == {'queued': 1, 'completed': 1}
+    assert queue.health_snapshot()['worker_diagnostics']['tasks_by_status'] == {'queued': 1, 'completed': 1}
+
+
+def test_cleanup_evicts_oldest_finished_tasks_beyond_cap(queue):
+    queue.max_retained_tasks = 2
+    now = time.time()
+    oldest = queue.add_task('soup one', 'Medium')
+    middle = queue.add_task('soup two', 'Medium')
+    active = queue.add_task('soup three', 'Medium')
+    finish(queue, oldest, completed_at=now - 20)
+    finish(queue, middle, completed_at=now - 10)
+
+    queue._cleanup_old_tasks()
+
+    assert set(queue.tasks) == {middle, active}
+    assert ('soup one', 'Medium') not in queue.task_ids_by_request
+    assert queue.status_counts_snapshot() == {'queued': 1, 'completed': 1}
+
+
+def test_cleanup_drops_tasks_past_retention_but_never_active_ones(queue):
+    now = time.time()
+    expired = queue.add_task('old stew', 'Medium')
+    queued = queue.add_task('new stew', 'Medium')
+    finish(queue, expired, completed_at=now - queue.task_retention_time - 1)
+    queue.last_cleanup = 0  # Due for its periodic run
+
+    queue._cleanup_old_tasks()
+
+    assert set(queue.tasks) == {queued}
@@ -0,0 +1,212 @@
+# test_web_app.py - /api/recipes cursor and search handling, and the saved-recipe short-circuit
+import base64
+import time
+
+import pytest
+
+import web_app
+from main import RecipeTask, TaskStatus
+
+
+class FakeSupabase:
+    """Records PostgREST calls instead of making them"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.selects = []
+        self.inserts = []
+
+    def select(self, table, params, timeout=None):
+        self.selects.append((table, params, timeout))
+        return self.rows
+
+    def select_one(self, table, params, timeout=None):
+        rows = self.select(table, params, timeout)
+        return rows[0] if rows else None
+
+    def insert(self, table, row, returning=False):
+        self.inserts.append((table, row))
+        return []
+
+
+@pytest.fixture
+def client():
+    web_app._invalidate_recipe_cache()
+    web_app._recipe_detail_cache.clear()
+    return web_app.app.test_client()
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    fake = FakeSupabase()
+    monkeypatch.setattr(web_app, 'supabase', fake)
+    return fake
+
+
+def raw_cursor(text):
+    return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii')
+
+
+# --- keyset cursor ---
+
+def test_cursor_round_trip_with_integer_id():
+    cursor = web_app._encode_recipe_cursor({'created_at': '2024-05-01T10:00:00.123456+00:00', 'id': 42})
+
+    assert web_app._recipe_cursor_filter(cursor) == (
+        '(or(created_at.lt."2024-05-01T10:00:00.123456+00:00",'
+        'and(created_at.eq."2024-05-01T10:00:00.123456+00:00",id.lt."42")))'
+    )
+
+
+def test_cursor_round_trip_with_uuid_id():
+    recipe_id = '3f2504e0-4f89-11d3-9a0c-0305e82c3301'
+    cursor = web_app._encode_recipe_cursor({'created_at': '2024-05-01T10:00:00+00:00', 'id': recipe_id})
+
+    assert f'id.lt."{recipe_id}"' in web_app._recipe_cursor_filter(cursor)
+
+
+@pytest.mark.parametrize('cursor', [
+    raw_cursor('a\\|1'),  # Backslash would escape PostgREST's closing quote
+    raw_cursor('2024-05-01T10:00:00|1"'),
+    raw_cursor('2024-05-01T10:00:00|1),id.gt.(0'),
+    raw_cursor('yesterday|1'),
+    raw_cursor('2024-05-01T10:00:00'),
+    'not base64!',
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        web_app._recipe_cursor_filter(cursor)
+
+
+def test_invalid_cursor_returns_400(client, fake_supabase):
+    response = client.get('/api/recipes', query_string={'cursor': raw_cursor('a\\|1')})
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid cursor'
+    assert fake_supabase.selects == []
+
+
+def test_full_page_returns_next_cursor(client, fake_supabase):
+    fake_supabase.rows = [
+        {'id': 2, 'title': 'Tacos', 'created_at': '2024-05-02T10:00:00+00:00'},
+        {'id': 1, 'title': 'Soup', 'created_at': '2024-05-01T10:00:00+00:00'},
+    ]
+
+    body = client.get('/api/recipes', query_string={'limit': 2}).get_json()
+
+    assert body['next_cursor'] == web_app._encode_recipe_cursor(fake_supabase.rows[-1])
+    _, params, _ = fake_supabase.selects[0]
+    assert params['order'] == 'created_at.desc,id.desc'
+    assert 'views_count' in params['select'].split(',')
+
+
+# --- static assets ---
+
+@pytest.mark.parametrize('accept_encoding, expected', [('gzip', 'gzip'), ('gzip, deflate, br', 'br')])
+def test_script_js_is_compressed(client, accept_encoding, expected):
+    response = client.get('/static/script.js', headers={'Accept-Encoding': accept_encoding})
+
+    assert response.headers['Content-Encoding'] == expected
+
+
+# --- search escaping ---
+
+@pytest.mark.parametrize('search, expected', [
+    ('tacos', 'ilike."*tacos*"'),
+    ('50%_off', 'ilike."*50\\\\%\\\\_off*"'),  # LIKE wildcards are matched literally
+    ('a*b', 'ilike."*ab*"'),  # PostgREST's own wildcard is dropped
+    ('say "hi"', 'ilike."*say \\"hi\\"*"'),
+    ('x,y)', 'ilike."*x,y)*"'),  # Quoted, so it can't close or=(...)
+])
+def test_ilike_contains_escapes_user_text(search, expected):
+    assert web_app._ilike_contains(search) == expected
+
+
+# --- saved-recipe short-circuit ---
+
+@pytest.fixture
+def no_queue_hit(monkeypatch):
+    monkeypatch.setattr(web_app.recipe_team.queue, 'has_reusable_task', lambda user_request, complexity: False)
+
+
+def test_saved_recipe_is_served_without_queueing(client, fake_supabase, no_queue_hit, monkeypatch):
+    fake_supabase.rows = [{'id': 7, 'title': 'Chicken Tacos', 'quality_score': 8.5, 'quality_level': 'Very Good'}]
+    monkeypatch.setattr(web_app.recipe_team, 'queue_recipe_generation', pytest.fail)
+
+    body = client.post('/api/generate-recipe', json={'recipe_request': '  Chicken   TACOS ', 'complexity': 'Gourmet'}).get_json()
+
+    assert body['cached'] is True
+    assert body['recipe']['id'] == 7
+    _, params, timeout = fake_supabase.selects[0]
+    assert params['request_norm'] == 'eq.chicken tacos'
+    assert params['difficulty'] == 'eq.Gourmet'
+    assert timeout == web_app.SAVED_RECIPE_LOOKUP_TIMEOUT
+
+
+def test_unknown_complexity_is_looked_up_as_medium(client, fake_supabase, no_queue_hit, monkeypatch):
+    monkeypatch.setattr(web_app.recipe_team, 'queue_recipe_generation', lambda user_request, complexity: 'task-1')
+
+    body = client.post('/api/generate-recipe', json={'recipe_request': 'chicken tacos', 'complexity': 'Extreme'}).get_json()
+
+    assert body['task_id'] == 'task-1'
+    assert fake_supabase.selects[0][1]['difficulty'] == 'eq.Medium'
+
+
+def test_lookup_is_skipped_when_the_queue_can_answer(client, fake_supabase, monkeypatch):
+    monkeypatch.setattr(web_app.recipe_team.queue, 'has_reusable_task', lambda user_request, complexity: True)
+    monkeypatch.setattr(web_app.recipe_team, 'queue_recipe_generation', lambda user_request, complexity: 'task-1')
+
+    body = client.post('/api/generate-recipe', json={'recipe_request': 'chicken tacos'}).get_json()
+
+    assert body['task_id'] == 'task-1'
+    assert fake_supabase.selects == []
+
+
+@pytest.mark.parametrize('payload', [
+    {'recipe_request': 42},
+    {'recipe_request': ['tacos']},
+    {'recipe_request': 'tacos', 'complexity': ['Medium']},
+])
+def test_non_string_fields_return_400(client, payload):
+    assert client.post('/api/generate-recipe', json=payload).status_code == 400
+
+
+# --- saving queued results ---
+
+def completed_task(user_request='chicken tacos', complexity='Medium'):
+    return RecipeTask(
+        task_id='task-1',
+        user_request=user_request,
+        complexity=complexity,
+        status=TaskStatus.PROCESSING,
+        created_at=time.time(),
+        progress={}
+    )
+
+
+def test_fallback_result_is_not_saved(fake_supabase):
+    result = {
+        'success': True,
+        'fallback_used': True,
+        'recipe': {'title': 'Basic Chicken Tacos'},
+        'complexity_requested': 'Medium'
+    }
+
+    web_app._save_completed_task(completed_task(), result)
+
+    assert fake_supabase.inserts == []
+
+
+def test_queued_result_is_saved_with_its_frontend_label(fake_supabase):
+    result = {
+        'success': True,
+        'recipe': {'title': 'Chicken Tacos', 'original_request': 'chicken tacos'},
+        'complexity_requested': 'High',
+        'generation_time': 12
+    }
+
+    web_app._save_completed_task(completed_task(complexity='High'), result)
+
+    [(table, row)] = fake_supabase.inserts
+    assert table == 'recipes'
+    assert row['difficulty'] == 'Gourmet'
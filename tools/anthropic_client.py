@@ -0,0 +1,18 @@
+# tools/anthropic_client.py - One Anthropic client, and so one keep-alive connection pool, per process
+import os
+import threading
+
+from anthropic import Anthropic
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> Anthropic:
+    """Shared Anthropic client, created on first use (after .env has been loaded)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:  # Double-check locking pattern
+                _client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+    return _client
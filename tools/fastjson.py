@@ -0,0 +1,34 @@
+# tools/fastjson.py - Fastest available JSON backend: orjson, then ujson (e.g. on PyPy), then stdlib json
+try:
+    import orjson
+
+    BACKEND = 'orjson'
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+
+    def dumps(obj, default=None) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    try:
+        import ujson
+
+        BACKEND = 'ujson'
+        JSONDecodeError = getattr(ujson, 'JSONDecodeError', ValueError)
+        loads = ujson.loads
+
+        def dumps(obj, default=None) -> bytes:
+            """Serialize obj to compact UTF-8 JSON bytes"""
+            return ujson.dumps(obj, default=default, ensure_ascii=False).encode('utf-8')
+
+    except ImportError:
+        import json
+
+        BACKEND = 'json'
+        JSONDecodeError = json.JSONDecodeError
+        loads = json.loads
+
+        def dumps(obj, default=None) -> bytes:
+            """Serialize obj to compact UTF-8 JSON bytes"""
+            return json.dumps(obj, default=default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,15 @@
+# tools/http_session.py - One pooled keep-alive requests.Session for the agents' outbound HTTP calls
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retries cover idempotent methods only (urllib3's default), so Edamam POSTs are never replayed
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+
+session = requests.Session()
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
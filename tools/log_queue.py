@@ -0,0 +1,67 @@
+# tools/log_queue.py - Non-blocking logging: callers only enqueue records, one listener thread writes them
+import atexit
+import logging
+import os
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+
+_listener = None
+_queue_handler = None
+
+
+def _start_listener():
+    """Give the QueueHandler a fresh queue and start a listener thread draining it"""
+    global _listener
+    log_queue = Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    _queue_handler.queue = log_queue
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def _restart_after_fork():
+    # gunicorn --preload forks workers after import; threads don't survive a fork, so without
+    # this the worker's records would pile up in a queue nothing drains. Start over with a new
+    # queue rather than reuse the parent's, whose lock may have been held mid-fork.
+    if _queue_handler is not None:
+        _start_listener()
+
+
+def _stop_listener():
+    if _listener is not None:
+        _listener.stop()
+
+
+def _level_from_env():
+    """LOG_LEVEL as a logging level and the unknown name it replaced, if any (falls back to INFO)"""
+    name = os.getenv('LOG_LEVEL', 'INFO').upper()
+    level = logging.getLevelName(name)
+    if isinstance(level, int):
+        return level, None
+    # An unknown name would make setLevel raise and stop the app from starting
+    return logging.INFO, name
+
+
+def configure_logging(level=None):
+    """Route the root logger through a QueueHandler at level, by default LOG_LEVEL (safe to call more than once)"""
+    global _queue_handler
+    if _queue_handler is not None:
+        return
+
+    unknown_level = None
+    if level is None:
+        level, unknown_level = _level_from_env()
+
+    _queue_handler = QueueHandler(Queue(-1))
+    _start_listener()
+    atexit.register(_stop_listener)
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+    # Added directly rather than via basicConfig, which would also format records in the QueueHandler
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+    if unknown_level:
+        logging.getLogger(__name__).warning("⚠️ Unknown LOG_LEVEL %r, using INFO", unknown_level)
@@ -0,0 +1,52 @@
+# tools/supabase_rest.py - Minimal PostgREST client over a pooled keep-alive connection
+from typing import Dict, List, Optional
+
+import httpx
+
+from tools import fastjson
+
+
+class SupabaseRest:
+    """Talks to Supabase's PostgREST API directly with one shared HTTP/2 connection pool"""
+
+    def __init__(self, url: str, key: str, timeout: float = 10.0):
+        self.rest_url = f"{url.rstrip('/')}/rest/v1"
+        self.client = httpx.Client(
+            base_url=self.rest_url,
+            headers={
+                'apikey': key,
+                'Authorization': f'Bearer {key}',
+                'Content-Type': 'application/json'
+            },
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60),
+            timeout=timeout
+        )
+
+    def select(self, table: str, params: Dict, timeout: Optional[float] = None) -> List[Dict]:
+        """GET rows using PostgREST query params, e.g. {'select': '*', 'id': 'eq.42'}; timeout overrides the client's"""
+        response = self.client.get(
+            f"/{table}",
+            params=params,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        )
+        response.raise_for_status()
+        return fastjson.loads(response.content)
+
+    def select_one(self, table: str, params: Dict, timeout: Optional[float] = None) -> Optional[Dict]:
+        """GET the first matching row, or None"""
+        rows = self.select(table, {**params, 'limit': 1}, timeout=timeout)
+        return rows[0] if rows else None
+
+    def insert(self, table: str, row: Dict, returning: bool = False) -> List[Dict]:
+        """POST a row; only asks PostgREST to echo it back when returning=True"""
+        response = self.client.post(
+            f"/{table}",
+            content=fastjson.dumps(row),
+            headers={'Prefer': 'return=representation' if returning else 'return=minimal'}
+        )
+        response.raise_for_status()
+        return fastjson.loads(response.content) if returning else []
+
+    def close(self):
+        self.client.close()
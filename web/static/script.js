@@ -14,6 +14,8 @@ class RecipeGenerator {
         this.errorMessage = document.getElementById('errorMessage');
         this.recentRecipesList = document.getElementById('recentRecipesList');
         this.recentRecipesSection = document.getElementById('recentRecipesSection');
+        this.recentRecipeTemplate = document.getElementById('recentRecipeTemplate');
+        this.recipeDetailTemplate = document.getElementById('recipeDetailTemplate');
         this.cookingFactsContainer = document.getElementById('cookingFactsContainer');
         this.cookingFact = document.getElementById('cookingFact');
         
@@ -185,6 +187,12 @@ class RecipeGenerator {
             if (e.target === this.recipeModal) this.closeModal();
         });
         
+        // Recent recipe cards (one delegated listener instead of an inline onclick per card)
+        this.recentRecipesList.addEventListener('click', (e) => {
+            const item = e.target.closest('.recent-recipe-item');
+            if (item) this.viewRecipe(item.dataset.recipeId);
+        });
+        
         // View all recipes link
         this.viewAllRecipesLink.addEventListener('click', (e) => {
             e.preventDefault();
@@ -730,99 +738,72 @@ class RecipeGenerator {
             return;
         }
         
-        const html = `
-            <div class="recipe-header">
-                <h1 class="recipe-title">${recipe.title}</h1>
-                <p class="recipe-description">${recipe.description || ''}</p>
-                
-                <div class="recipe-meta">
-                    <span class="meta-item">⏱️ Prep: ${recipe.prep_time}</span>
-                    <span class="meta-item">🔥 Cook: ${recipe.cook_time}</span>
-                    <span class="meta-item">👥 Serves: ${recipe.servings}</span>
-                    <span class="meta-item">📊 ${recipe.difficulty}</span>
-                </div>
-            </div>
-            
-            <div class="recipe-section">
-                <h2 class="section-title">🥘 Ingredients</h2>
-                <div class="ingredients-grid">
-                    ${(recipe.ingredients || []).map(ingredient => 
-                        `<div class="ingredient-item">${ingredient}</div>`
-                    ).join('')}
-                </div>
-            </div>
-            
-            <div class="recipe-section">
-                <h2 class="section-title">👨‍🍳 Instructions</h2>
-                <div class="instructions-list">
-                    ${(recipe.instructions || []).map(instruction => 
-                        `<div class="instruction-item">${instruction}</div>`
-                    ).join('')}
-                </div>
-            </div>
-            
-            ${nutrition && nutrition.nutrition_per_serving ? `
-            <div class="recipe-section">
-                <h2 class="section-title">📊 Nutrition (per serving)</h2>
-                <div class="nutrition-grid">
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutrition.nutrition_per_serving.calories || 'N/A'}</div>
-                        <div class="nutrition-label">Calories</div>
-                    </div>
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutrition.nutrition_per_serving.protein || 'N/A'}g</div>
-                        <div class="nutrition-label">Protein</div>
-                    </div>
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutrition.nutrition_per_serving.carbs || 'N/A'}g</div>
-                        <div class="nutrition-label">Carbs</div>
-                    </div>
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutrition.nutrition_per_serving.fat || 'N/A'}g</div>
-                        <div class="nutrition-label">Fat</div>
-                    </div>
-                </div>
-                
-                ${nutrition.health_insights && nutrition.health_insights.length > 0 ? `
-                <div class="health-insights">
-                    <h3>💡 Health Insights</h3>
-                    <ul>
-                        ${nutrition.health_insights.slice(0, 3).map(insight => 
-                            `<li>${insight}</li>`
-                        ).join('')}
-                    </ul>
-                </div>
-                ` : ''}
-            </div>
-            ` : ''}
-            
-            ${recipe.enhancements_made && recipe.enhancements_made.length > 0 ? `
-            <div class="recipe-section">
-                <h2 class="section-title">✨ AI Enhancements</h2>
-                <div class="enhancement-list">
-                    <ul>
-                        ${recipe.enhancements_made.map(enhancement => 
-                            `<li>${enhancement}</li>`
-                        ).join('')}
-                    </ul>
-                </div>
-            </div>
-            ` : ''}
-            
-            <div class="generation-stats">
-                <p><strong>Generated in ${data.generation_time || data.result?.generation_time || 'unknown'} seconds with ${data.iterations || data.result?.iterations || 1} iteration${(data.iterations || data.result?.iterations || 1) > 1 ? 's' : ''}</strong></p>
-                <p style="margin-top: 10px; color: #666;">Complexity: ${recipe.difficulty}</p>
-                <div style="margin-top: 15px;">
-                    <button onclick="recipeApp.printCurrentRecipe()" class="print-recipe-btn">🖨️ Print Recipe</button>
-                </div>
-            </div>
-        `;
+        const detail = this.buildRecipeDetail(recipe, nutrition, 'result');
+        const field = (name) => detail.querySelector(`[data-field="${name}"]`);
+        const iterations = data.iterations || data.result?.iterations || 1;
+        field('generated').textContent = `Generated in ${data.generation_time || data.result?.generation_time || 'unknown'} seconds with ${iterations} iteration${iterations > 1 ? 's' : ''}`;
+        field('complexity').textContent = `Complexity: ${recipe.difficulty}`;
+        detail.querySelector('.print-recipe-btn').addEventListener('click', () => this.printCurrentRecipe());
         
-        this.recipeResult.innerHTML = html;
+        this.recipeResult.replaceChildren(detail);
         this.recipeResult.style.display = 'block';
         this.recipeResult.scrollIntoView({ behavior: 'smooth' });
     }
     
+    buildRecipeDetail(recipe, nutrition, view) {
+        // Clone the shared detail markup and fill it through textContent only - recipe text
+        // comes from the model and must never be parsed as HTML
+        const detail = this.recipeDetailTemplate.content.cloneNode(true);
+        const field = (name) => detail.querySelector(`[data-field="${name}"]`);
+        const section = (name) => detail.querySelector(`[data-section="${name}"]`);
+        const fillList = (container, items, tagName, className) => {
+            for (const text of items) {
+                const item = document.createElement(tagName);
+                if (className) item.className = className;
+                item.textContent = text;
+                container.appendChild(item);
+            }
+        };
+        
+        // Drop the parts that belong to the other view ('result' or 'modal')
+        detail.querySelectorAll(`[data-view]:not([data-view="${view}"])`).forEach(el => el.remove());
+        
+        if (view === 'result') field('title').textContent = recipe.title;
+        field('description').textContent = recipe.description || '';
+        field('prep').textContent = `⏱️ Prep: ${recipe.prep_time}`;
+        field('cook').textContent = `🔥 Cook: ${recipe.cook_time}`;
+        field('servings').textContent = `👥 Serves: ${recipe.servings}`;
+        field('difficulty').textContent = `📊 ${recipe.difficulty}`;
+        fillList(field('ingredients'), recipe.ingredients || [], 'div', 'ingredient-item');
+        fillList(field('instructions'), recipe.instructions || [], 'div', 'instruction-item');
+        
+        const perServing = nutrition && nutrition.nutrition_per_serving;
+        if (perServing) {
+            field('calories').textContent = perServing.calories || 'N/A';
+            field('protein').textContent = `${perServing.protein || 'N/A'}g`;
+            field('carbs').textContent = `${perServing.carbs || 'N/A'}g`;
+            field('fat').textContent = `${perServing.fat || 'N/A'}g`;
+            
+            const insights = nutrition.health_insights || [];
+            if (insights.length > 0) {
+                fillList(field('insights'), insights.slice(0, 3), 'li');
+            } else {
+                section('insights').remove();
+            }
+        } else {
+            section('nutrition').remove();
+        }
+        
+        const enhancements = recipe.enhancements_made || [];
+        if (enhancements.length > 0) {
+            fillList(field('enhancements'), enhancements, 'li');
+        } else {
+            section('enhancements').remove();
+        }
+        
+        return detail;
+    }
+    
     async loadRecentRecipes(filters = {}) {
         try {
             console.log('📋 loadRecentRecipes called with filters:', filters);
@@ -852,29 +833,29 @@ class RecipeGenerator {
             console.log('📋 API Response:', data);
             
             if (data.success && data.recipes.length > 0) {
-                const html = data.recipes.map(recipe => `
-                    <div class="recent-recipe-item" data-recipe-id="${recipe.id}" onclick="recipeApp.viewRecipe(this.dataset.recipeId)">
-                        <div>
-                            <strong>${recipe.title}</strong>
-                            <br>
-                            <small style="color: #666;">
-                                ${recipe.meal_type || 'Unknown'} • ${recipe.difficulty || 'Unknown'}
-                            </small>
-                            ${recipe.views_count ? `<div class="recipe-views">👁️ ${recipe.views_count} views</div>` : ''}
-                        </div>
-                        <div style="color: #999; font-size: 0.9rem;">
-                            ${new Date(recipe.created_at).toLocaleDateString()}
-                        </div>
-                    </div>
-                `).join('');
+                const fragment = document.createDocumentFragment();
+                for (const recipe of data.recipes) {
+                    const item = this.recentRecipeTemplate.content.firstElementChild.cloneNode(true);
+                    const field = (name) => item.querySelector(`[data-field="${name}"]`);
+                    item.dataset.recipeId = recipe.id;
+                    field('title').textContent = recipe.title;
+                    field('meta').textContent = `${recipe.meal_type || 'Unknown'} • ${recipe.difficulty || 'Unknown'}`;
+                    if (recipe.views_count) {
+                        const views = field('views');
+                        views.textContent = `👁️ ${recipe.views_count} views`;
+                        views.hidden = false;
+                    }
+                    field('date').textContent = new Date(recipe.created_at).toLocaleDateString();
+                    fragment.appendChild(item);
+                }
                 
-                this.recentRecipesList.innerHTML = html;
+                this.recentRecipesList.replaceChildren(fragment);
                 console.log('📋 Updated recipe list with', data.recipes.length, 'recipes');
                 
                 if (Object.keys(filters).some(key => filters[key] && filters[key] !== 'all')) {
                     const filterInfo = document.createElement('div');
                     filterInfo.style.cssText = 'background: #e3f2fd; padding: 10px; border-radius: 8px; margin-bottom: 15px; color: #1976d2;';
-                    filterInfo.innerHTML = `📊 Found ${data.count} recipes matching your search`;
+                    filterInfo.textContent = `📊 Found ${data.count} recipes matching your search`;
                     this.recentRecipesList.insertBefore(filterInfo, this.recentRecipesList.firstChild);
                     console.log('📋 Added filter info banner');
                 }
@@ -973,94 +954,12 @@ class RecipeGenerator {
     displayRecipeInModal(recipe) {
         this.modalRecipeTitle.textContent = recipe.title;
         
-        const nutritionData = recipe.nutrition_data;
-        const nutritionHtml = nutritionData && nutritionData.nutrition_per_serving ? `
-            <div class="recipe-section">
-                <h2 class="section-title">📊 Nutrition (per serving)</h2>
-                <div class="nutrition-grid">
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutritionData.nutrition_per_serving.calories || 'N/A'}</div>
-                        <div class="nutrition-label">Calories</div>
-                    </div>
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutritionData.nutrition_per_serving.protein || 'N/A'}g</div>
-                        <div class="nutrition-label">Protein</div>
-                    </div>
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutritionData.nutrition_per_serving.carbs || 'N/A'}g</div>
-                        <div class="nutrition-label">Carbs</div>
-                    </div>
-                    <div class="nutrition-card">
-                        <div class="nutrition-value">${nutritionData.nutrition_per_serving.fat || 'N/A'}g</div>
-                        <div class="nutrition-label">Fat</div>
-                    </div>
-                </div>
-                
-                ${nutritionData.health_insights && nutritionData.health_insights.length > 0 ? `
-                <div class="health-insights">
-                    <h3>💡 Health Insights</h3>
-                    <ul>
-                        ${nutritionData.health_insights.slice(0, 3).map(insight => 
-                            `<li>${insight}</li>`
-                        ).join('')}
-                    </ul>
-                </div>
-                ` : ''}
-            </div>
-        ` : '';
-        
-        const html = `
-            <div class="recipe-header">
-                <p class="recipe-description">${recipe.description || ''}</p>
-                
-                <div class="recipe-meta">
-                    <span class="meta-item">⏱️ Prep: ${recipe.prep_time}</span>
-                    <span class="meta-item">🔥 Cook: ${recipe.cook_time}</span>
-                    <span class="meta-item">👥 Serves: ${recipe.servings}</span>
-                    <span class="meta-item">📊 ${recipe.difficulty}</span>
-                </div>
-            </div>
-            
-            <div class="recipe-section">
-                <h2 class="section-title">🥘 Ingredients</h2>
-                <div class="ingredients-grid">
-                    ${recipe.ingredients.map(ingredient => 
-                        `<div class="ingredient-item">${ingredient}</div>`
-                    ).join('')}
-                </div>
-            </div>
-            
-            <div class="recipe-section">
-                <h2 class="section-title">👨‍🍳 Instructions</h2>
-                <div class="instructions-list">
-                    ${recipe.instructions.map(instruction => 
-                        `<div class="instruction-item">${instruction}</div>`
-                    ).join('')}
-                </div>
-            </div>
-            
-            ${nutritionHtml}
-            
-            ${recipe.enhancements_made && recipe.enhancements_made.length > 0 ? `
-            <div class="recipe-section">
-                <h2 class="section-title">✨ AI Enhancements</h2>
-                <div class="enhancement-list">
-                    <ul>
-                        ${recipe.enhancements_made.map(enhancement => 
-                            `<li>${enhancement}</li>`
-                        ).join('')}
-                    </ul>
-                </div>
-            </div>
-            ` : ''}
-            
-            <div class="generation-stats">
-                <p>Generated ${recipe.iterations_count} iteration${recipe.iterations_count > 1 ? 's' : ''} • Views: ${recipe.views_count || 0}</p>
-                <p style="margin-top: 5px; color: #666;">Created: ${new Date(recipe.created_at).toLocaleDateString()}</p>
-            </div>
-        `;
+        const detail = this.buildRecipeDetail(recipe, recipe.nutrition_data, 'modal');
+        const field = (name) => detail.querySelector(`[data-field="${name}"]`);
+        field('usage').textContent = `Generated ${recipe.iterations_count} iteration${recipe.iterations_count > 1 ? 's' : ''} • Views: ${recipe.views_count || 0}`;
+        field('created').textContent = `Created: ${new Date(recipe.created_at).toLocaleDateString()}`;
         
-        this.modalRecipeContent.innerHTML = html;
+        this.modalRecipeContent.replaceChildren(detail);
         this.recipeModal.style.display = 'block';
         document.body.style.overflow = 'hidden';
     }
@@ -1122,7 +1021,10 @@ class RecipeGenerator {
         
         // Create a clean print version of the modal content
         const modalContent = this.modalRecipeContent.cloneNode(true);
-        const modalTitle = this.modalRecipeTitle.textContent;
+        // Serialize the title through the DOM so the print window gets it escaped, not as markup
+        const titleHolder = document.createElement('span');
+        titleHolder.textContent = this.modalRecipeTitle.textContent;
+        const modalTitle = titleHolder.innerHTML;
         
         // Create a new window for printing
         const printWindow = window.open('', '_blank');
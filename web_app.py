@@ -1,44 +1,192 @@
 # web_app.py - Railway-compatible version with simple queue
 import os
+import re
 import sys
+import gzip
+import base64
 import time
-import traceback
+import hashlib
+import atexit
+import logging
+import threading
+import uuid
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from cachetools import TTLCache
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 from dotenv import load_dotenv
+try:
+    import brotli  # Installed alongside Flask-Compress
+except ImportError:
+    brotli = None
+from tools import fastjson
+from tools.log_queue import configure_logging
 
-# Optional: Supabase client
-from supabase import create_client, Client
+# Optional: Supabase (PostgREST) client
+from tools.supabase_rest import SupabaseRest
 
 # Load environment variables
 load_dotenv()
 
+# Non-blocking logging: request threads only enqueue records, a listener thread writes them.
+# LOG_LEVEL sets the root level, so it covers main.py and the agents too (WARNING in production skips tracebacks)
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Add agents folder to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'agents'))
 
 # Import recipe team with simple queue
 try:
-    from main import get_recipe_team
+    from main import get_recipe_team, normalize_request
     recipe_team = get_recipe_team()
-    print("✅ Recipe Agent Team with queue initialized")
+    logger.info("✅ Recipe Agent Team with queue initialized")
 except ImportError as e:
-    print(f"❌ Could not import RecipeAgentTeam: {e}")
+    logger.error("❌ Could not import RecipeAgentTeam: %s", e)
     recipe_team = None
 
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by tools.fastjson - serializes straight to UTF-8 bytes"""
+
+    def dumps_bytes(self, obj) -> bytes:
+        return fastjson.dumps(obj, default=self.default)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return fastjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
 # Flask app setup
 app = Flask(__name__, static_folder='web/static', template_folder='web/templates')
+app.json = FastJSONProvider(app)
+# Match /api/recipes/ as /api/recipes without a 308 redirect round trip (set before routes bind)
+app.url_map.strict_slashes = False
 CORS(app)
 
+# Compress large JSON (recipe-status results) and static assets; responses that
+# already carry a Content-Encoding (pre-gzipped index, cached lists) are left alone
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'text/javascript', 'application/javascript']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']  # Brotli first for browsers that offer it
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip']  # Static files are streamed; the default leaves out gzip
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_BR_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# Bound request bodies - a recipe request is a short JSON object
+app.config['MAX_CONTENT_LENGTH'] = 4096
+MAX_RECIPE_REQUEST_LENGTH = 200  # Mirrors maxlength on the recipe input
+INDEX_MAX_AGE = 3600  # Seconds browsers may cache the index page
+VERSIONED_ASSET_MAX_AGE = 31536000  # Content-hashed static URLs never change
+VERSIONED_ASSETS = ('styles.css', 'script.js')
+MAX_SEARCH_LENGTH = 64
+SAVED_RECIPE_LOOKUP_TIMEOUT = 1.0  # Seconds; a slow lookup just falls through to generation
+
+# Frontend complexity labels (and the agent levels themselves) -> agent complexity levels
+COMPLEXITY_MAPPING = {
+    'Simple': 'Easy',
+    'Medium': 'Medium',
+    'Gourmet': 'High',
+    'Easy': 'Easy',
+    'High': 'High'
+}
+
+# Agent complexity level -> the frontend label stored in recipes.difficulty (what the list filter
+# and the saved-recipe lookup query), so queued and synchronous saves use one vocabulary
+DIFFICULTY_LABELS = {
+    'Easy': 'Simple',
+    'Medium': 'Medium',
+    'High': 'Gourmet'
+}
+
+# Columns the recipe list view needs - the JSON blobs (ingredients, instructions,
+# nutrition_data, chef_notes...) are only fetched by /api/recipes/<id> or ?fields=all
+RECIPE_LIST_COLUMNS = 'id,title,description,prep_time,cook_time,servings,difficulty,meal_type,cuisine_type,tags,quality_score,views_count,created_at'
+_LIKE_SPECIAL_CHARS = re.compile(r'([\\%_])')
+
+# Constant response bodies, serialized once at import
+_NOT_FOUND_BODY = app.json.dumps_bytes({'error': 'Endpoint not found'})
+_SERVER_ERROR_BODY = app.json.dumps_bytes({'error': 'Internal server error'})
+_REQUEST_TOO_LARGE_BODY = app.json.dumps_bytes({'error': 'Request body too large'})
+
 # Supabase setup
 supabase_url = os.getenv('SUPABASE_URL')
 supabase_key = os.getenv('SUPABASE_ANON_KEY')
-supabase: Client = create_client(supabase_url, supabase_key) if supabase_url and supabase_key else None
-print("✅ Supabase client initialized" if supabase else "❌ Supabase client not initialized")
+supabase = SupabaseRest(supabase_url, supabase_key) if supabase_url and supabase_key else None
+if supabase:
+    atexit.register(supabase.close)
+logger.info("✅ Supabase client initialized" if supabase else "❌ Supabase client not initialized")
+
+# Serialized /api/recipes responses keyed by query, cleared whenever a recipe is saved
+_recipe_response_cache = TTLCache(maxsize=512, ttl=30)
+# Single-recipe responses; rows are never updated after insert, so these live longer and survive saves
+_recipe_detail_cache = TTLCache(maxsize=1000, ttl=300)
+_recipe_response_cache_lock = threading.Lock()
+
+# Health fields that cannot change after startup
+_HEALTH_BASE = {
+    'status': 'healthy',
+    'service': 'recipe-agent-team',
+    'agents_available': recipe_team is not None,
+    'database_connected': supabase is not None,
+}
+
+# Health probes arrive several times a second - format the timestamp at most once per second.
+# One (second, text) tuple swapped atomically, so concurrent probes never see a mismatched pair
+_health_timestamp = (0, '')
+
+def _current_timestamp():
+    global _health_timestamp
+    second = int(time.time())
+    cached = _health_timestamp
+    if cached[0] != second:
+        cached = _health_timestamp = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
+def _static_asset_hash(filename):
+    with open(os.path.join(app.static_folder, filename), 'rb') as asset_file:
+        return hashlib.blake2b(asset_file.read(), digest_size=8).hexdigest()
+
+# index.html has no template variables - read and gzip it once instead of rendering per request,
+# stamping asset URLs with a content hash so browsers can cache them for a year
+with open(os.path.join(app.root_path, app.template_folder, 'index.html'), 'rb') as index_file:
+    INDEX_HTML = index_file.read()
+# Only same-origin href="/static/..." and src="/static/..." references are stamped
+for _asset in VERSIONED_ASSETS:
+    _asset_hash = _static_asset_hash(_asset)
+    for _attr in ('href', 'src'):
+        INDEX_HTML = INDEX_HTML.replace(
+            f'{_attr}="/static/{_asset}"'.encode(), f'{_attr}="/static/{_asset}?v={_asset_hash}"'.encode()
+        )
+# Drop indentation and blank lines; line breaks stay, so the inline script's // comments are safe
+INDEX_HTML = b'\n'.join(line.strip() for line in INDEX_HTML.splitlines() if line.strip())
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML, compresslevel=9)
+INDEX_HTML_BR = brotli.compress(INDEX_HTML, quality=11) if brotli else None
+INDEX_ETAG = hashlib.blake2b(INDEX_HTML, digest_size=8).hexdigest()
+
+@app.after_request
+def cache_versioned_assets(response):
+    # Only the content-hashed URLs the index page links to are safe to cache forever
+    if request.endpoint == 'static' and request.args.get('v') and response.status_code == 200:
+        response.headers['Cache-Control'] = f'public, max-age={VERSIONED_ASSET_MAX_AGE}, immutable'
+    return response
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return _conditional_response(
+        INDEX_HTML, INDEX_ETAG, mimetype='text/html',
+        cache_control=f'public, max-age={INDEX_MAX_AGE}',
+        gzipped_body=INDEX_HTML_GZ, brotli_body=INDEX_HTML_BR
+    )
 
 @app.route('/api/generate-recipe', methods=['POST'])
 def generate_recipe():
@@ -46,75 +194,134 @@ def generate_recipe():
     if not recipe_team:
         return jsonify({'error': 'Recipe agent not available'}), 500
 
+    # No blanket try here: unexpected errors reach Flask, which logs them and uses the 500 handler
+    # Parse the raw body directly, skipping Werkzeug's JSON/charset handling
     try:
-        data = request.get_json()
-        user_request = data.get('recipe_request', '').strip()
-        complexity = data.get('complexity', 'Medium')
-        use_queue = data.get('use_queue', True)  # Allow disabling queue for testing
-
-        if not user_request:
-            return jsonify({'error': 'Recipe request is required'}), 400
-
-        # Validate and map complexity
-        complexity_mapping = {
-            'Simple': 'Easy',
-            'Medium': 'Medium',
-            'Gourmet': 'High'
-        }
+        data = fastjson.loads(request.get_data(cache=False) or b'{}')
+    except fastjson.JSONDecodeError:
+        return jsonify({'error': 'Request body must be valid JSON'}), 400
+    if not isinstance(data, dict):
+        data = {}
+    user_request = data.get('recipe_request') or ''
+    complexity = data.get('complexity', 'Medium')
+    use_queue = data.get('use_queue', True)  # Allow disabling queue for testing
+
+    # With no catch-all around this handler, a wrongly typed field must be a 400, not a 500
+    if not isinstance(user_request, str) or not isinstance(complexity, str):
+        return jsonify({'error': 'recipe_request and complexity must be strings'}), 400
+
+    user_request = user_request[:MAX_RECIPE_REQUEST_LENGTH].strip()
+    if not user_request:
+        return jsonify({'error': 'Recipe request is required'}), 400
+
+    # Map complexity; anything unrecognised falls back to Medium
+    backend_complexity = COMPLEXITY_MAPPING.get(complexity, 'Medium')
+    difficulty = DIFFICULTY_LABELS[backend_complexity]
+
+    logger.info("🌐 Recipe request: %s (Complexity: %s)", user_request, backend_complexity)
+
+    # Same request already generated and saved (possibly before a restart) - skip the agents.
+    # A retained task in the queue answers it without the database round trip.
+    saved = None
+    if supabase and not (use_queue and recipe_team.queue.has_reusable_task(user_request, backend_complexity)):
+        saved = _find_saved_recipe(user_request, difficulty)
+    if saved:
+        return jsonify(saved)
+
+    if use_queue:
+        # Queue the recipe generation (non-blocking)
+        task_id = recipe_team.queue_recipe_generation(user_request, backend_complexity)
         
-        backend_complexity = complexity_mapping.get(complexity, complexity)
-        valid_complexity_levels = ['Easy', 'Medium', 'High']
-        if backend_complexity not in valid_complexity_levels:
-            backend_complexity = 'Medium'
+        return jsonify({
+            'success': True,
+            'task_id': task_id,
+            'status': 'queued',
+            'message': 'Recipe generation queued. Use task_id to check status.',
+            'complexity_requested': complexity
+        })
+    else:
+        # Synchronous generation (for backward compatibility)
+        start_time = time.time()
+        result = recipe_team.generate_recipe(user_request, backend_complexity)
+        generation_time = int(time.time() - start_time)
 
-        print(f"🌐 Recipe request: {user_request} (Complexity: {backend_complexity})")
+        if result.get('success'):
+            # Save to database, skipping the fallback placeholder (see _save_completed_task)
+            if supabase and not result.get('fallback_used'):
+                try:
+                    recipe_record = _prepare_recipe_for_db(result, user_request, difficulty, generation_time)
+                    supabase.insert('recipes', recipe_record.to_row())
+                    _invalidate_recipe_cache()
+                except Exception as db_error:
+                    logger.warning("⚠️ Database save failed: %s", db_error, exc_info=logger.isEnabledFor(logging.DEBUG))
 
-        if use_queue:
-            # Queue the recipe generation (non-blocking)
-            task_id = recipe_team.queue_recipe_generation(user_request, backend_complexity)
-            
             return jsonify({
                 'success': True,
-                'task_id': task_id,
-                'status': 'queued',
-                'message': 'Recipe generation queued. Use task_id to check status.',
+                'recipe': result['recipe'],
+                'nutrition': result.get('nutrition'),
+                'quality': result.get('quality'),
+                'iterations': result.get('iterations'),
+                'generation_time': generation_time,
                 'complexity_requested': complexity
             })
         else:
-            # Synchronous generation (for backward compatibility)
-            start_time = time.time()
-            result = recipe_team.generate_recipe(user_request, backend_complexity)
-            generation_time = int(time.time() - start_time)
-
-            if result.get('success'):
-                # Save to database
-                if supabase:
-                    try:
-                        recipe_data = _prepare_recipe_for_db(result, user_request, complexity, generation_time)
-                        supabase.table('recipes').insert(recipe_data).execute()
-                    except Exception as db_error:
-                        print(f"⚠️ Database save failed: {db_error}")
-
-                return jsonify({
-                    'success': True,
-                    'recipe': result['recipe'],
-                    'nutrition': result.get('nutrition'),
-                    'quality': result.get('quality'),
-                    'iterations': result.get('iterations'),
-                    'generation_time': generation_time,
-                    'complexity_requested': complexity
-                })
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': result.get('error', 'Recipe generation failed')
-                }), 500
+            return jsonify({
+                'success': False,
+                'error': result.get('error', 'Recipe generation failed')
+            }), 500
 
-    except Exception as e:
-        print(f"❌ API Error: {str(e)}")
-        traceback.print_exc()
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
 
+def _find_saved_recipe(user_request, difficulty):
+    """Response body for the newest saved recipe with the same normalized request and difficulty label, or None"""
+    try:
+        row = supabase.select_one('recipes', {
+            'select': '*',
+            'request_norm': f'eq.{normalize_request(user_request)}',
+            'difficulty': f'eq.{difficulty}',
+            'order': 'created_at.desc'
+        }, timeout=SAVED_RECIPE_LOOKUP_TIMEOUT)
+    except Exception as db_error:
+        logger.warning("⚠️ Saved recipe lookup failed: %s", db_error)
+        return None
+    
+    if not row:
+        return None
+    
+    logger.info("♻️ Serving saved recipe %s for '%s'", row.get('id'), user_request)
+    return {
+        'success': True,
+        'recipe': row,
+        'nutrition': row.get('nutrition_data'),
+        'quality': {'score': row.get('quality_score'), 'quality_level': row.get('quality_level')},
+        'iterations': row.get('iterations_count'),
+        'generation_time': 0,
+        'complexity_requested': difficulty,
+        'cached': True
+    }
+
+def _save_completed_task(task, result):
+    """Save a queued recipe from its processing thread, once, before status polls report it completed"""
+    if result.get('fallback_used'):
+        # Placeholder from the agent-less fallback - saving it would make the saved-recipe lookup serve it for good
+        logger.info("⏭️ Not saving fallback recipe for '%s'", task.user_request)
+        return
+    
+    try:
+        original_request = result['recipe'].get('original_request', task.user_request)
+        # complexity_requested is the agent level here - store its frontend label
+        complexity = DIFFICULTY_LABELS.get(result.get('complexity_requested'), 'Medium')
+        generation_time = result.get('generation_time', 0)
+        
+        recipe_record = _prepare_recipe_for_db(result, original_request, complexity, generation_time)
+        supabase.insert('recipes', recipe_record.to_row())
+        _invalidate_recipe_cache()
+        logger.info("✅ Recipe saved to database: %s", recipe_record.title)
+        
+    except Exception as db_error:
+        logger.warning("⚠️ Database save failed: %s", db_error, exc_info=logger.isEnabledFor(logging.DEBUG))
+
+if recipe_team and supabase:
+    recipe_team.set_completion_handler(_save_completed_task)
 
 @app.route('/api/recipe-status/<task_id>', methods=['GET'])
 def get_recipe_status(task_id):
@@ -129,58 +336,140 @@ def get_recipe_status(task_id):
         if status.get('error'):  # This handles null/None properly
             return jsonify(status), 404
         
-        # If completed, save to database
-        if status['status'] == 'completed' and status.get('result') and supabase:
-            try:
-                result = status['result']
-                
-                # Extract original request info from task
-                original_request = result['recipe'].get('original_request', 'Unknown request')
-                complexity = result.get('complexity_requested', 'Medium')
-                generation_time = result.get('generation_time', 0)
-                
-                recipe_data = _prepare_recipe_for_db(result, original_request, complexity, generation_time)
-                supabase.table('recipes').insert(recipe_data).execute()
-                print(f"✅ Recipe saved to database: {recipe_data.get('title')}")
-                
-            except Exception as db_error:
-                print(f"⚠️ Database save failed: {db_error}")
-
         # Return 200 for valid status
         return jsonify(status), 200
 
     except Exception as e:
-        print(f"❌ Status check error: {str(e)}")
+        logger.error("❌ Status check error: %s", e)
         return jsonify({'error': f'Status check failed: {str(e)}'}), 500
     
 
+@dataclass(slots=True)
+class RecipeRecord:
+    """Fixed-schema row for the Supabase recipes table"""
+    title: Optional[str]
+    description: Optional[str]
+    original_request: str
+    prep_time: Optional[str]
+    cook_time: Optional[str]
+    total_time: Optional[str]
+    servings: Optional[str]
+    difficulty: str
+    ingredients: List[str]
+    instructions: List[str]
+    tags: List[str]
+    cuisine_type: Optional[str]
+    meal_type: Optional[str]
+    enhanced: bool
+    enhancements_made: List[str]
+    chef_notes: List[str]
+    quality_score: float
+    quality_level: str
+    iterations_count: int
+    nutrition_data: Optional[Dict]
+    nutrition_score: Optional[float]
+    dietary_tags: List[str]
+    generation_time_seconds: int
+
+    def to_row(self) -> Dict:
+        """Shallow dict for the insert call (dataclasses.asdict would deep-copy every list)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 def _prepare_recipe_for_db(result, original_request, complexity, generation_time):
     """Helper to prepare recipe data for database storage"""
-    return {
-        'title': result['recipe'].get('title'),
-        'description': result['recipe'].get('description'),
-        'original_request': original_request,
-        'prep_time': result['recipe'].get('prep_time'),
-        'cook_time': result['recipe'].get('cook_time'),
-        'total_time': result['recipe'].get('total_time'),
-        'servings': result['recipe'].get('servings'),
-        'difficulty': complexity,  # Use frontend complexity
-        'ingredients': result['recipe'].get('ingredients', []),
-        'instructions': result['recipe'].get('instructions', []),
-        'tags': result['recipe'].get('tags', []),
-        'cuisine_type': result['recipe'].get('cuisine_type'),
-        'meal_type': result['recipe'].get('meal_type'),
-        'enhanced': result['recipe'].get('enhanced', False),
-        'enhancements_made': result['recipe'].get('enhancements_made', []),
-        'chef_notes': result['recipe'].get('chef_notes', []),
-        'quality_score': result.get('quality', {}).get('score', 7.0),
-        'quality_level': result.get('quality', {}).get('quality_level', 'Good'),
-        'iterations_count': result.get('iterations', 1),
-        'nutrition_data': result.get('nutrition'),
-        'nutrition_score': result.get('nutrition', {}).get('nutrition_score'),
-        'dietary_tags': result.get('nutrition', {}).get('dietary_tags', []),
-        'generation_time_seconds': generation_time
-    }
+    recipe = result['recipe']
+    quality = result.get('quality') or {}
+    nutrition = result.get('nutrition') or {}
+    return RecipeRecord(
+        title=recipe.get('title'),
+        description=recipe.get('description'),
+        original_request=original_request,
+        prep_time=recipe.get('prep_time'),
+        cook_time=recipe.get('cook_time'),
+        total_time=recipe.get('total_time'),
+        servings=recipe.get('servings'),
+        difficulty=complexity,  # Use frontend complexity
+        ingredients=recipe.get('ingredients', []),
+        instructions=recipe.get('instructions', []),
+        tags=recipe.get('tags', []),
+        cuisine_type=recipe.get('cuisine_type'),
+        meal_type=recipe.get('meal_type'),
+        enhanced=recipe.get('enhanced', False),
+        enhancements_made=recipe.get('enhancements_made', []),
+        chef_notes=recipe.get('chef_notes', []),
+        quality_score=quality.get('score', 7.0),
+        quality_level=quality.get('quality_level', 'Good'),
+        iterations_count=result.get('iterations', 1),
+        nutrition_data=result.get('nutrition'),
+        nutrition_score=nutrition.get('nutrition_score'),
+        dietary_tags=nutrition.get('dietary_tags', []),
+        generation_time_seconds=generation_time
+    )
+
+def _ilike_contains(search):
+    """PostgREST ilike operand matching search anywhere, treating the user's text literally"""
+    # Escape LIKE wildcards, then quote for PostgREST so commas/parens can't break out of or=(...)
+    pattern = _LIKE_SPECIAL_CHARS.sub(r'\\\1', search.replace('*', ''))
+    quoted = pattern.replace('\\', '\\\\').replace('"', '\\"')
+    return f'ilike."*{quoted}*"'
+
+def _encode_recipe_cursor(recipe):
+    """Opaque keyset cursor pointing just past this row in (created_at, id) order"""
+    raw = f"{recipe['created_at']}|{recipe['id']}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def _recipe_cursor_filter(cursor):
+    """PostgREST and=(...) operand selecting rows after the cursor; raises ValueError if malformed"""
+    created_at, recipe_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+    # Rebuild both values from parsed types so nothing from the client reaches the filter
+    # verbatim - a stray quote or backslash could otherwise close the quoted operand
+    created_at = datetime.fromisoformat(created_at).isoformat()
+    recipe_id = str(int(recipe_id)) if recipe_id.isdigit() else str(uuid.UUID(recipe_id))
+    return (f'(or(created_at.lt."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.lt."{recipe_id}")))')
+
+def _cache_json_body(cache_key, payload, cache=_recipe_response_cache):
+    """Serialize and gzip payload once and cache the (body, etag, gzipped_body) entry for repeat queries"""
+    body = app.json.dumps_bytes(payload)
+    entry = (body, hashlib.blake2b(body, digest_size=8).hexdigest(), gzip.compress(body))
+    with _recipe_response_cache_lock:
+        cache[cache_key] = entry
+    return entry
+
+def _get_cached_json_body(cache_key, cache=_recipe_response_cache):
+    with _recipe_response_cache_lock:
+        return cache.get(cache_key)
+
+def _cached_json_response(entry):
+    """Conditional response for a _cache_json_body entry, reusing its precompressed body"""
+    body, etag, gzipped_body = entry
+    return _conditional_response(body, etag, gzipped_body=gzipped_body)
+
+def _invalidate_recipe_cache():
+    with _recipe_response_cache_lock:
+        _recipe_response_cache.clear()
+
+def _conditional_response(body, etag, mimetype='application/json', cache_control='no-cache',
+                          gzipped_body=None, brotli_body=None):
+    """Send a serialized body with its ETag; answer 304 on a match and compress when accepted"""
+    accept_encoding = request.headers.get('Accept-Encoding', '')
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    elif brotli_body is not None and 'br' in accept_encoding:
+        # Only precompressed bodies are served as Brotli; compressing per request stays gzip
+        response = Response(brotli_body, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'br'
+    elif 'gzip' in accept_encoding:
+        response = Response(gzipped_body or gzip.compress(body), mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype=mimetype)
+
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    # API data changes whenever a recipe is saved, so it defaults to revalidating via no-cache
+    response.headers['Cache-Control'] = cache_control
+    return response
 
 # Helper function is now module-level
 
@@ -189,32 +478,48 @@ def get_recipes():
     """Get recipes with filters"""
     try:
         limit = min(int(request.args.get("limit", 10)), 50)
-        search = request.args.get("search", "").strip()
+        search = request.args.get("search", "").strip()[:MAX_SEARCH_LENGTH]
         meal_type = request.args.get("meal_type", "").strip()
         difficulty = request.args.get("difficulty", "").strip()
+        columns = "*" if request.args.get("fields") == "all" else RECIPE_LIST_COLUMNS
+        cursor = request.args.get("cursor", "").strip()
         
-        query = supabase.table("recipes").select("*")
+        cache_key = ('recipes', limit, search, meal_type, difficulty, columns, cursor)
+        cached = _get_cached_json_body(cache_key)
+        if cached:
+            return _cached_json_response(cached)
+        
+        # Keyset pagination on (created_at, id): every page is an index range scan, no OFFSET
+        params = {"select": columns, "order": "created_at.desc,id.desc", "limit": limit}
+        
+        if cursor:
+            try:
+                params["and"] = _recipe_cursor_filter(cursor)
+            except (ValueError, UnicodeDecodeError):
+                return jsonify({"success": False, "error": "Invalid cursor"}), 400
         
         if search:
-            query = query.or_(f"title.ilike.%{search}%,description.ilike.%{search}%")
+            # Served by the trigram indexes in migrations/001_recipes_search_trgm.sql
+            search_filter = _ilike_contains(search)
+            params["or"] = f"(title.{search_filter},description.{search_filter})"
         
         if meal_type and meal_type != "all":
-            query = query.eq("meal_type", meal_type)
+            params["meal_type"] = f"eq.{meal_type}"
         
         if difficulty and difficulty != "all":
-            query = query.eq("difficulty", difficulty)
+            params["difficulty"] = f"eq.{difficulty}"
         
-        query = query.order("created_at", desc=True).limit(limit)
-        result = query.execute()
+        recipes = supabase.select("recipes", params)
 
-        return jsonify({
+        return _cached_json_response(_cache_json_body(cache_key, {
             "success": True,
-            "recipes": result.data,
-            "count": len(result.data)
-        })
+            "recipes": recipes,
+            "count": len(recipes),
+            "next_cursor": _encode_recipe_cursor(recipes[-1]) if len(recipes) == limit else None
+        }))
 
     except Exception as e:
-        print("Error in get_recipes:", str(e))
+        logger.error("❌ Error in get_recipes: %s", e)
         return jsonify({
             "success": False,
             "message": "Failed to retrieve recipes",
@@ -225,12 +530,17 @@ def get_recipes():
 def get_recipe_by_id(recipe_id):
     """Get individual recipe by ID"""
     try:
-        result = supabase.table('recipes').select("*").eq('id', recipe_id).single().execute()
-        if result.data:
-            return jsonify({
+        cache_key = ('recipe', recipe_id)
+        cached = _get_cached_json_body(cache_key, _recipe_detail_cache)
+        if cached:
+            return _cached_json_response(cached)
+        
+        recipe = supabase.select_one('recipes', {'select': '*', 'id': f'eq.{recipe_id}'})
+        if recipe:
+            return _cached_json_response(_cache_json_body(cache_key, {
                 'success': True,
-                'recipe': result.data
-            })
+                'recipe': recipe
+            }, _recipe_detail_cache))
         else:
             return jsonify({'success': False, 'error': 'Recipe not found'}), 404
     except Exception as e:
@@ -239,39 +549,16 @@ def get_recipe_by_id(recipe_id):
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint with detailed queue diagnostics"""
-    queue_stats = {}
-    worker_diagnostics = {}
-    
+    snapshot = {}
     if recipe_team and hasattr(recipe_team, 'queue'):
-        with recipe_team.queue.lock:
-            queue_stats = {
-                'processing_count': recipe_team.queue.processing_count,
-                'max_concurrent': recipe_team.queue.max_concurrent,
-                'total_tasks': len(recipe_team.queue.tasks),
-                'queue_size': recipe_team.queue.queue.qsize() if hasattr(recipe_team.queue.queue, 'qsize') else 'unknown'
-            }
-            
-            # CRITICAL: Check if worker thread is alive
-            worker_diagnostics = {
-                'worker_thread_exists': recipe_team.queue.worker_thread is not None,
-                'worker_thread_alive': recipe_team.queue.worker_thread.is_alive() if recipe_team.queue.worker_thread else False,
-                'worker_running_flag': recipe_team.queue.running,
-                'tasks_by_status': {}
-            }
-            
-            # Count tasks by status
-            for task in recipe_team.queue.tasks.values():
-                status = task.status.value
-                worker_diagnostics['tasks_by_status'][status] = worker_diagnostics['tasks_by_status'].get(status, 0) + 1
+        # Non-blocking: probes never contend with task dispatch for the queue lock
+        snapshot = recipe_team.queue.health_snapshot()
     
     return jsonify({
-        'status': 'healthy',
-        'service': 'recipe-agent-team',
-        'timestamp': datetime.now().isoformat(),
-        'agents_available': recipe_team is not None,
-        'database_connected': supabase is not None,
-        'queue_stats': queue_stats,
-        'worker_diagnostics': worker_diagnostics  # NEW: Worker thread diagnostics
+        **_HEALTH_BASE,
+        'timestamp': _current_timestamp(),
+        'queue_stats': snapshot.get('queue_stats', {}),
+        'worker_diagnostics': snapshot.get('worker_diagnostics', {})
     })
 
 # Also add a debug endpoint to restart the worker if needed
@@ -284,7 +571,7 @@ def restart_worker():
     try:
         # Check if worker is dead
         if recipe_team.queue.worker_thread is None or not recipe_team.queue.worker_thread.is_alive():
-            print("🚨 Worker thread is dead, restarting...")
+            logger.warning("🚨 Worker thread is dead, restarting...")
             
             # Stop the old worker
             recipe_team.queue.running = False
@@ -314,6 +601,18 @@ def restart_worker():
             'error': str(e)
         }), 500
 
+@app.errorhandler(404)
+def not_found(e):
+    return Response(_NOT_FOUND_BODY, status=404, mimetype='application/json')
+
+@app.errorhandler(413)
+def request_too_large(e):
+    return Response(_REQUEST_TOO_LARGE_BODY, status=413, mimetype='application/json')
+
+@app.errorhandler(500)
+def internal_error(e):
+    return Response(_SERVER_ERROR_BODY, status=500, mimetype='application/json')
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8000))
     app.run(host='0.0.0.0', port=port)
\ No newline at end of file